@@ -3,7 +3,8 @@ Application configuration and settings
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -55,8 +56,20 @@ class Settings(BaseSettings):
     MAX_PRICE_HISTORY: int = Field(default=1000, env="MAX_PRICE_HISTORY")
     DATA_RETENTION_HOURS: int = Field(default=24, env="DATA_RETENTION_HOURS")
 
+    # Historical Fetch Config
+    FETCH_CONCURRENCY: int = Field(default=8, env="FETCH_CONCURRENCY")
+    FETCH_REQUESTS_PER_MINUTE: int = Field(
+        default=300, env="FETCH_REQUESTS_PER_MINUTE"
+    )
+    FETCH_CACHE_DIR: str = Field(default=".cache/prices", env="FETCH_CACHE_DIR")
+
+    # CORS
+    CORS_ALLOW_ORIGINS: List[str] = Field(default=["*"], env="CORS_ALLOW_ORIGINS")
+
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = Field(default=60, env="RATE_LIMIT_PER_MINUTE")
+    # Only enable behind a proxy that overwrites X-Forwarded-For
+    TRUST_FORWARDED_FOR: bool = Field(default=False, env="TRUST_FORWARDED_FOR")
 
     # Database Config
     DATABASE_HOST: str = Field(..., env="DATABASE_HOST")
@@ -65,11 +78,20 @@ class Settings(BaseSettings):
     DATABASE_NAME: str = Field(..., env="DATABASE_NAME")
     DATABASE_PORT: int = Field(default=5432, env="DATABASE_PORT")
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
+    DB_POOL_MIN: int = Field(default=5, env="DB_POOL_MIN")
+    DB_POOL_MAX: int = Field(default=30, env="DB_POOL_MAX")
+    # Off trades durability of the last few commits for faster inserts; price
+    # data lost in a crash can be fetched again
+    DB_SYNCHRONOUS_COMMIT: bool = Field(default=True, env="DB_SYNCHRONOUS_COMMIT")
+    # Drop and recreate all tables on startup (destroys stored data)
+    DB_RESET: bool = Field(default=False, env="DB_RESET")
 
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance, loading it on first use"""
+    return Settings()
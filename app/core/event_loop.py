@@ -0,0 +1,23 @@
+"""
+Event loop selection for the command-line scripts
+"""
+
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """asyncio.run, on a uvloop event loop when uvloop is installed"""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def using_uvloop() -> bool:
+    """Whether the running event loop is uvloop's"""
+    return uvloop is not None and isinstance(asyncio.get_running_loop(), uvloop.Loop)
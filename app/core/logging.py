@@ -4,11 +4,16 @@ Logging configuration for the Gold Trading Dashboard
 
 import logging
 import logging.handlers
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from .config import settings
+from .config import get_settings
+
+# Background listener that owns the file handler (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(
@@ -26,12 +31,15 @@ def setup_logging(
         max_bytes: Maximum log file size in bytes
         backup_count: Number of backup log files to keep
     """
+    global _queue_listener
 
-    # Determine log level
-    level = getattr(logging, (log_level or settings.LOG_LEVEL).upper(), logging.INFO)
+    default_level, formatter = _logging_defaults()
 
-    # Create custom formatter
-    formatter = logging.Formatter(fmt=settings.LOG_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+    # Determine log level
+    if log_level:
+        level = getattr(logging, log_level.upper(), logging.INFO)
+    else:
+        level = default_level
 
     # Setup root logger
     root_logger = logging.getLogger()
@@ -40,6 +48,7 @@ def setup_logging(
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    shutdown_logging()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -47,7 +56,8 @@ def setup_logging(
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
-    # File handler (if log_file specified)
+    # File handler (if log_file specified), written from a background thread
+    # so logging calls on the event loop never block on disk I/O
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -57,7 +67,13 @@ def setup_logging(
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Configure third-party loggers
     configure_third_party_loggers(level)
@@ -69,6 +85,26 @@ def setup_logging(
         logger.info(f"📁 Log file: {log_file}")
 
 
+@lru_cache(maxsize=1)
+def _logging_defaults() -> Tuple[int, logging.Formatter]:
+    """Resolve the default level and formatter from settings once"""
+    settings = get_settings()
+    level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+    formatter = logging.Formatter(fmt=settings.LOG_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+    return level, formatter
+
+
+def shutdown_logging() -> None:
+    """Flush queued file log records and stop the background listener"""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def configure_third_party_loggers(level: int) -> None:
     """Configure logging levels for third-party libraries"""
 
@@ -85,6 +121,7 @@ def configure_third_party_loggers(level: int) -> None:
     logging.getLogger("app").setLevel(level)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name
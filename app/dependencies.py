@@ -4,96 +4,132 @@ Service factory and dependency injection for the Gold Trading Dashboard
 
 import asyncio
 from typing import Optional
-from functools import lru_cache
 
 from .services.capital import CapitalAPIService
 from .services.websocket import WebSocketManager
 from .services.database import DatabaseService
-from .core.config import settings
+from .services.data_fetcher import GoldDataFetcher
 from .core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 class ServiceContainer:
-    """Service container for dependency injection"""
+    """Service container for dependency injection
+
+    Services are created and initialized lazily on first access, so requests
+    that never touch the database or Capital.com do not pay for them.
+    """
 
     def __init__(self):
         self._capital_service: Optional[CapitalAPIService] = None
         self._websocket_manager: Optional[WebSocketManager] = None
         self._database_service: Optional[DatabaseService] = None
+        self._fetcher: Optional[GoldDataFetcher] = None
+        self._database_lock = asyncio.Lock()
+        self._capital_lock = asyncio.Lock()
+        self._websocket_lock = asyncio.Lock()
+        self._fetcher_lock = asyncio.Lock()
+        self._streaming_lock = asyncio.Lock()
+        self._streaming_started: bool = False
         self._initialized: bool = False
 
     async def initialize(self) -> None:
-        """Initialize all services"""
+        """Prepare the container; services start on first use"""
         if self._initialized:
             return
 
-        logger.info("🚀 Initializing service container...")
-
-        # Initialize database service first
-        self._database_service = DatabaseService()
-        await self._database_service.initialize()
-
-        # Initialize Capital service
-        self._capital_service = CapitalAPIService()
-        await self._capital_service.initialize()
-
-        # Initialize WebSocket manager
-        self._websocket_manager = WebSocketManager()
-        await self._websocket_manager.initialize()
-
-        # Start streaming with price callback
-        await self._capital_service.start_streaming(
-            self._websocket_manager.broadcast_price_update
-        )
-
         self._initialized = True
-        logger.info("✅ Service container initialized successfully!")
+        logger.info("✅ Service container ready (services start on demand)")
 
     async def cleanup(self) -> None:
-        """Cleanup all services"""
-        if not self._initialized:
-            return
-
+        """Cleanup all services that were started"""
         logger.info("🧹 Cleaning up service container...")
 
-        if self._database_service:
-            await self._database_service.cleanup()
-            self._database_service = None
-
-        if self._capital_service:
-            await self._capital_service.cleanup()
-            self._capital_service = None
-
-        if self._websocket_manager:
-            await self._websocket_manager.cleanup()
-            self._websocket_manager = None
+        services = [
+            service
+            for service in (
+                self._fetcher,
+                self._database_service,
+                self._capital_service,
+                self._websocket_manager,
+            )
+            if service is not None
+        ]
+        self._fetcher = None
+        self._database_service = None
+        self._capital_service = None
+        self._websocket_manager = None
+
+        # Clean up concurrently; one failure must not skip the others
+        results = await asyncio.gather(
+            *(service.cleanup() for service in services), return_exceptions=True
+        )
+        for service, result in zip(services, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"❌ Error cleaning up {type(service).__name__}: {result}"
+                )
 
+        self._streaming_started = False
         self._initialized = False
         logger.info("✅ Service container cleanup completed!")
 
-    @property
-    def database_service(self) -> DatabaseService:
-        """Get database service instance"""
-        if not self._database_service:
-            raise RuntimeError("Database service not initialized")
+    async def get_database_service(self) -> DatabaseService:
+        """Get database service instance, initializing it on first use"""
+        if self._database_service is None:
+            async with self._database_lock:
+                if self._database_service is None:
+                    service = DatabaseService()
+                    await service.initialize()
+                    self._database_service = service
         return self._database_service
 
-    @property
-    def capital_service(self) -> CapitalAPIService:
-        """Get Capital service instance"""
-        if not self._capital_service:
-            raise RuntimeError("Capital service not initialized")
+    async def get_capital_service(self) -> CapitalAPIService:
+        """Get Capital service instance, initializing it on first use"""
+        if self._capital_service is None:
+            async with self._capital_lock:
+                if self._capital_service is None:
+                    service = CapitalAPIService()
+                    await service.initialize()
+                    self._capital_service = service
         return self._capital_service
 
-    @property
-    def websocket_manager(self) -> WebSocketManager:
-        """Get WebSocket manager instance"""
-        if not self._websocket_manager:
-            raise RuntimeError("WebSocket manager not initialized")
+    async def get_websocket_manager(self) -> WebSocketManager:
+        """Get WebSocket manager instance, initializing it on first use"""
+        if self._websocket_manager is None:
+            async with self._websocket_lock:
+                if self._websocket_manager is None:
+                    manager = WebSocketManager()
+                    await manager.initialize()
+                    self._websocket_manager = manager
         return self._websocket_manager
 
+    async def get_fetcher(self) -> GoldDataFetcher:
+        """Get the shared historical data fetcher, initializing it on first use"""
+        if self._fetcher is None:
+            async with self._fetcher_lock:
+                if self._fetcher is None:
+                    fetcher = GoldDataFetcher(await self.get_capital_service())
+                    await fetcher.initialize()
+                    self._fetcher = fetcher
+        return self._fetcher
+
+    async def ensure_streaming(self) -> WebSocketManager:
+        """Start Capital.com price streaming into the WebSocket manager once"""
+        if not self._streaming_started:
+            async with self._streaming_lock:
+                if not self._streaming_started:
+                    # Independent startups, so run them concurrently
+                    capital_service, websocket_manager = await asyncio.gather(
+                        self.get_capital_service(), self.get_websocket_manager()
+                    )
+                    await capital_service.start_streaming(
+                        websocket_manager.broadcast_price_update
+                    )
+                    self._streaming_started = True
+        return await self.get_websocket_manager()
+
     @property
     def is_initialized(self) -> bool:
         """Check if services are initialized"""
@@ -127,19 +163,26 @@ async def cleanup_services() -> None:
         _service_container = None
 
 
-@lru_cache()
-def get_database_service() -> DatabaseService:
+async def get_database_service() -> DatabaseService:
     """Dependency injection for Database service"""
-    return get_service_container().database_service
+    return await get_service_container().get_database_service()
 
 
-@lru_cache()
-def get_capital_service() -> CapitalAPIService:
+async def get_capital_service() -> CapitalAPIService:
     """Dependency injection for Capital service"""
-    return get_service_container().capital_service
+    return await get_service_container().get_capital_service()
 
 
-@lru_cache()
-def get_websocket_manager() -> WebSocketManager:
+async def get_websocket_manager() -> WebSocketManager:
     """Dependency injection for WebSocket manager"""
-    return get_service_container().websocket_manager
+    return await get_service_container().get_websocket_manager()
+
+
+async def get_fetcher() -> GoldDataFetcher:
+    """Dependency injection for the historical data fetcher"""
+    return await get_service_container().get_fetcher()
+
+
+async def get_streaming_websocket_manager() -> WebSocketManager:
+    """Dependency injection for WebSocket manager with price streaming running"""
+    return await get_service_container().ensure_streaming()
@@ -9,13 +9,15 @@ from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
+from starlette.middleware.cors import CORSMiddleware
 
-from .core.config import settings
-from .core.logging import setup_logging
+from .core.config import get_settings
+from .core.logging import setup_logging, shutdown_logging
 from .dependencies import initialize_services, cleanup_services, get_service_container
+from .services.http import close_session
 from .routers.websocket import websocket_router
 from .routers.api import api_router
-from .middleware import ErrorHandlerMiddleware, RateLimitMiddleware, CORSMiddleware
+from .middleware import ErrorHandlerMiddleware, RateLimitMiddleware
 
 
 @asynccontextmanager
@@ -47,13 +49,19 @@ async def lifespan(app: FastAPI):
 
         # Cleanup all services
         await cleanup_services()
+        await close_session()
 
         logger.info("👋 Application shutdown completed!")
 
+        # Drain any queued file log records
+        shutdown_logging()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
 
+    settings = get_settings()
+
     # Setup logging
     setup_logging()
 
@@ -68,11 +76,21 @@ def create_app() -> FastAPI:
     )
 
     # Add middleware
-    app.add_middleware(ErrorHandlerMiddleware)
     app.add_middleware(
-        RateLimitMiddleware, calls_per_minute=settings.RATE_LIMIT_PER_MINUTE
+        ErrorHandlerMiddleware, trust_forwarded_for=settings.TRUST_FORWARDED_FOR
+    )
+    app.add_middleware(
+        RateLimitMiddleware,
+        calls_per_minute=settings.RATE_LIMIT_PER_MINUTE,
+        trust_forwarded_for=settings.TRUST_FORWARDED_FOR,
+    )
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ALLOW_ORIGINS,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization"],
+        max_age=86400,
     )
-    app.add_middleware(CORSMiddleware)
 
     # Mount static files
     app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -108,6 +126,7 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
@@ -0,0 +1,36 @@
+"""
+Client address resolution shared by the middleware
+"""
+
+from starlette.types import Scope
+
+
+def client_ip(scope: Scope, trust_forwarded_for: bool = False) -> str:
+    """
+    Resolve the client IP for a request, computing it once per request
+
+    Args:
+        scope: ASGI connection scope
+        trust_forwarded_for: Use the first X-Forwarded-For address when present
+
+    Returns:
+        Client IP address, or "unknown" if it cannot be determined
+    """
+    state = scope.setdefault("state", {})
+    cached = state.get("client_ip")
+    if cached is not None:
+        return cached
+
+    ip = None
+    if trust_forwarded_for:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                ip = value.split(b",", 1)[0].strip().decode("latin-1") or None
+                break
+
+    if ip is None:
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+
+    state["client_ip"] = ip
+    return ip
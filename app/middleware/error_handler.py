@@ -2,65 +2,85 @@
 Error handling middleware
 """
 
+import secrets
 import time
-import uuid
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..core.logging import get_logger
+from .client import client_ip
 
 logger = get_logger(__name__)
 
+# Health probes are polled frequently, so their requests are not logged
+_QUIET_PATHS = frozenset({"/health", "/api/health"})
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+
+class ErrorHandlerMiddleware:
     """Middleware to handle errors and add request logging"""
 
-    async def dispatch(self, request: Request, call_next):
-        # Generate request ID
-        request_id = str(uuid.uuid4())[:8]
-        request.state.request_id = request_id
+    def __init__(self, app: ASGIApp, trust_forwarded_for: bool = False):
+        self.app = app
+        self.trust_forwarded_for = trust_forwarded_for
 
-        # Start timing
-        start_time = time.time()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Log request
-        logger.info(
-            f"🔍 [{request_id}] {request.method} {request.url.path} - "
-            f"Client: {request.client.host if request.client else 'unknown'}"
-        )
+        # Generate request ID
+        request_id = secrets.token_hex(4)
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_header = (b"x-request-id", request_id.encode())
 
-        try:
-            # Process request
-            response = await call_next(request)
+        # Start timing
+        start_time = time.perf_counter()
 
-            # Calculate duration
-            duration = time.time() - start_time
+        quiet = scope["path"] in _QUIET_PATHS
 
-            # Log response
+        # Log request
+        if not quiet:
             logger.info(
-                f"✅ [{request_id}] {response.status_code} - "
-                f"Duration: {duration:.3f}s"
+                "🔍 [%s] %s %s - Client: %s",
+                request_id,
+                scope["method"],
+                scope["path"],
+                client_ip(scope, self.trust_forwarded_for),
             )
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
+        response_started = False
+        status_code = 500
 
-            return response
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal response_started, status_code
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                # Add request ID to response headers
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_request_id)
 
         except Exception as e:
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Log error
             logger.error(
                 f"❌ [{request_id}] Error: {str(e)} - " f"Duration: {duration:.3f}s"
             )
 
+            # Too late to replace a response that is already on the wire
+            if response_started:
+                raise
+
             # Return error response
             if isinstance(e, StarletteHTTPException):
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=e.status_code,
                     content={
                         "error": e.detail,
@@ -69,7 +89,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     },
                 )
             else:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=500,
                     content={
                         "error": "Internal server error",
@@ -77,3 +97,14 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                         "timestamp": time.time(),
                     },
                 )
+            await response(scope, receive, send_with_request_id)
+            return
+
+        # Calculate duration
+        duration = time.perf_counter() - start_time
+
+        # Log response
+        if not quiet:
+            logger.info(
+                "✅ [%s] %s - Duration: %.3fs", request_id, status_code, duration
+            )
@@ -3,48 +3,58 @@ Rate limiting middleware
 """
 
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from collections import OrderedDict, deque
+from typing import Deque
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..core.logging import get_logger
+from .client import client_ip as resolve_client_ip
 
 logger = get_logger(__name__)
 
+# Paths exempt from rate limiting
+_SKIP_PATHS = frozenset(
+    {"/health", "/api/health", "/docs", "/redoc", "/openapi.json"}
+)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+
+class RateLimitMiddleware:
     """Simple rate limiting middleware"""
 
-    def __init__(self, app, calls_per_minute: int = 60):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls_per_minute: int = 60,
+        sweep_interval: int = 1000,
+        max_tracked_ips: int = 10000,
+        trust_forwarded_for: bool = False,
+    ):
+        self.app = app
         self.calls_per_minute = calls_per_minute
-        self.client_requests = {}
+        self.sweep_interval = sweep_interval
+        self.max_tracked_ips = max_tracked_ips
+        self.trust_forwarded_for = trust_forwarded_for
+        # Ordered from least to most recently seen client
+        self.client_requests: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._requests_since_sweep = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/docs", "/redoc"]:
-            return await call_next(request)
+        if scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-
-        # Clean old entries
-        cutoff_time = current_time - 60  # 1 minute ago
-        if client_ip in self.client_requests:
-            self.client_requests[client_ip] = [
-                req_time
-                for req_time in self.client_requests[client_ip]
-                if req_time > cutoff_time
-            ]
+        client_ip = resolve_client_ip(scope, self.trust_forwarded_for)
 
-        # Check rate limit
-        if client_ip not in self.client_requests:
-            self.client_requests[client_ip] = []
-
-        if len(self.client_requests[client_ip]) >= self.calls_per_minute:
-            logger.warning(f"⚠️ Rate limit exceeded for {client_ip}")
-            return JSONResponse(
+        if not self._admit(client_ip):
+            logger.warning("⚠️ Rate limit exceeded for %s", client_ip)
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
@@ -52,8 +62,54 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "window": "1 minute",
                 },
             )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _admit(self, client_ip: str) -> bool:
+        """
+        Record a request for client_ip if it is within the limit
+
+        Kept synchronous on purpose: with no await between the limit check and
+        the append, concurrent requests cannot both pass the same check.
+        """
+        current_time = time.monotonic()
+        cutoff_time = current_time - 60  # 1 minute ago
+
+        # Periodically drop idle clients so the table stays bounded
+        self._requests_since_sweep += 1
+        if self._requests_since_sweep >= self.sweep_interval:
+            self._sweep(cutoff_time)
+
+        request_times = self.client_requests.get(client_ip)
+        if request_times is None:
+            request_times = deque(maxlen=self.calls_per_minute)
+            self.client_requests[client_ip] = request_times
+            # Evict least recently seen clients beyond the cap
+            while len(self.client_requests) > self.max_tracked_ips:
+                self.client_requests.popitem(last=False)
+        else:
+            self.client_requests.move_to_end(client_ip)
+
+        # Clean old entries (timestamps are appended in order)
+        while request_times and request_times[0] <= cutoff_time:
+            request_times.popleft()
+
+        # Check rate limit
+        if len(request_times) >= self.calls_per_minute:
+            return False
 
         # Add current request
-        self.client_requests[client_ip].append(current_time)
+        request_times.append(current_time)
+        return True
 
-        return await call_next(request)
+    def _sweep(self, cutoff_time: float) -> None:
+        """Remove clients with no requests inside the current window"""
+        self._requests_since_sweep = 0
+        # Idle clients sit at the front, so stop at the first active one
+        while self.client_requests:
+            request_times = next(iter(self.client_requests.values()))
+            if request_times and request_times[-1] > cutoff_time:
+                break
+            self.client_requests.popitem(last=False)
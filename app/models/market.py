@@ -4,7 +4,8 @@ Pydantic models for gold price data
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -38,21 +39,25 @@ class MarketStatus(str, Enum):
 class PriceTick(BaseModel):
     """Individual price tick"""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     bid: Optional[float] = None
     ask: Optional[float] = None
     mid: Optional[float] = None
     volume: Optional[int] = None
 
-    @property
+    @cached_property
     def price(self) -> Optional[float]:
-        """Get the most relevant price"""
+        """Get the most relevant price (computed once; ticks are immutable)"""
         return self.mid or self.ask or self.bid
 
 
 class OHLC(BaseModel):
     """OHLC candlestick data"""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     open: float
     high: float
@@ -65,6 +70,8 @@ class OHLC(BaseModel):
 class MarketData(BaseModel):
     """Complete market data"""
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: str = "XAU/USD"
     current_price: Optional[float] = None
     bid: Optional[float] = None
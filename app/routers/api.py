@@ -3,11 +3,14 @@ API routes for market data and health checks
 """
 
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
+import orjson
 
-from ..dependencies import get_capital_service, get_websocket_manager
+from ..dependencies import get_capital_service, get_fetcher, get_websocket_manager
 from ..services.capital import CapitalAPIService
+from ..services.data_fetcher import GoldDataFetcher
 from ..services.websocket import WebSocketManager
 from ..models.market import MarketData
 from ..core.logging import get_logger
@@ -16,15 +19,43 @@ logger = get_logger(__name__)
 
 api_router = APIRouter()
 
+# Pre-encoded /health body; only the timestamp changes between calls
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'","service":"Gold Trading Platform"}'
+_HEALTH_HEADERS = {"Cache-Control": "no-cache"}
+
+
+def _json_response(content: Dict[str, Any]) -> Response:
+    """
+    Encode a response body with orjson, skipping FastAPI's jsonable_encoder
+
+    Used by the routes that return sample price records. orjson encodes their
+    datetimes natively, so the encoder's per-value walk is pure overhead.
+    """
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
+async def _count_with_sample(
+    batches: AsyncIterator[List[Dict[str, Any]]], sample_size: int
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Count streamed records, keeping only the first sample_size of them"""
+    data_count = 0
+    sample: List[Dict[str, Any]] = []
+    async for batch in batches:
+        if len(sample) < sample_size:
+            sample.extend(batch[: sample_size - len(sample)])
+        data_count += len(batch)
+    return data_count, sample
+
 
 @api_router.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "Gold Trading Platform",
-    }
+    return Response(
+        content=_HEALTH_PREFIX + datetime.now().isoformat().encode() + _HEALTH_SUFFIX,
+        media_type="application/json",
+        headers=_HEALTH_HEADERS,
+    )
 
 
 @api_router.get("/gold-live")
@@ -32,20 +63,21 @@ async def get_live_gold_data(
     capital_service: CapitalAPIService = Depends(get_capital_service),
 ) -> Dict[str, Any]:
     """Get live gold price data"""
+    timestamp = datetime.now().isoformat()
     try:
         gold_data = await capital_service.get_current_price("GOLD")
 
         if gold_data:
             return {
                 "success": True,
-                "data": gold_data.dict(),
-                "timestamp": datetime.now().isoformat(),
+                "data": gold_data.model_dump(),
+                "timestamp": timestamp,
             }
         else:
             return {
                 "success": False,
                 "error": "No gold data available",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
     except Exception as e:
@@ -53,7 +85,7 @@ async def get_live_gold_data(
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
@@ -62,20 +94,21 @@ async def get_gold_market_info(
     capital_service: CapitalAPIService = Depends(get_capital_service),
 ) -> Dict[str, Any]:
     """Get gold market information"""
+    timestamp = datetime.now().isoformat()
     try:
         market_info = await capital_service.get_market_info("GOLD")
 
         if market_info:
             return {
                 "success": True,
-                "data": market_info.dict(),
-                "timestamp": datetime.now().isoformat(),
+                "data": market_info.model_dump(),
+                "timestamp": timestamp,
             }
         else:
             return {
                 "success": False,
                 "error": "No market info available",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
     except Exception as e:
@@ -83,7 +116,7 @@ async def get_gold_market_info(
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
@@ -93,12 +126,13 @@ async def get_connection_status(
     websocket_manager: WebSocketManager = Depends(get_websocket_manager),
 ) -> Dict[str, Any]:
     """Get connection status"""
+    timestamp = datetime.now().isoformat()
     try:
         return {
             "capital_connected": capital_service.is_connected,
             "websocket_streaming": capital_service.is_streaming,
             "active_connections": len(websocket_manager.connections),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
     except Exception as e:
         logger.error(f"❌ Error getting connection status: {e}")
@@ -107,178 +141,179 @@ async def get_connection_status(
             "websocket_streaming": False,
             "active_connections": 0,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
-@api_router.get("/fetch-historical-data")
+@api_router.get("/fetch-historical-data", response_model=None)
 async def fetch_historical_gold_data(
     days: int = 30,
     resolution: str = "MINUTE_5",
     max_pages: int = 10,
-    capital_service: CapitalAPIService = Depends(get_capital_service),
-) -> Dict[str, Any]:
+    fetcher: GoldDataFetcher = Depends(get_fetcher),
+) -> Union[Response, Dict[str, Any]]:
     """Fetch historical gold data using API pagination"""
+    timestamp = datetime.now().isoformat()
     try:
-        from ..services.data_fetcher import GoldDataFetcher
-
-        # Create data fetcher
-        fetcher = GoldDataFetcher(capital_service)
-        await fetcher.initialize()
-
-        try:
-            # Calculate date range - use older dates that have data
-            to_date = datetime.now() - timedelta(days=30)  # Go back 30 days
-            from_date = to_date - timedelta(days=days)  # Then go back 'days' from there
-
-            logger.info(f"🔍 Fetching {days} days of {resolution} data")
-            logger.info(
-                f"📅 Using date range: {from_date.strftime('%Y-%m-%d')} to {to_date.strftime('%Y-%m-%d')}"
-            )
-
-            # Fetch data
-            data = await fetcher.fetch_historical_prices(
+        # Calculate date range - use older dates that have data
+        to_date = datetime.now() - timedelta(days=30)  # Go back 30 days
+        from_date = to_date - timedelta(days=days)  # Then go back 'days' from there
+
+        logger.info(f"🔍 Fetching {days} days of {resolution} data")
+        logger.info(
+            f"📅 Using date range: {from_date.strftime('%Y-%m-%d')} to {to_date.strftime('%Y-%m-%d')}"
+        )
+
+        # Fetch data page by page, keeping only the first 5 records as sample
+        data_count, sample_data = await _count_with_sample(
+            fetcher.stream_historical_prices(
                 resolution=resolution,
                 max_pages=max_pages,
                 from_date=from_date,
                 to_date=to_date,
-            )
+            ),
+            5,
+        )
 
-            return {
+        return _json_response(
+            {
                 "success": True,
-                "message": f"Successfully fetched {len(data)} records",
-                "data_count": len(data),
+                "message": f"Successfully fetched {data_count} records",
+                "data_count": data_count,
                 "date_range": {
                     "from": from_date.isoformat(),
                     "to": to_date.isoformat(),
                 },
                 "resolution": resolution,
-                "sample_data": (
-                    data[:5] if data else []
-                ),  # Return first 5 records as sample
-                "timestamp": datetime.now().isoformat(),
+                "sample_data": sample_data,
+                "timestamp": timestamp,
             }
-
-        finally:
-            await fetcher.cleanup()
+        )
 
     except Exception as e:
         logger.error(f"❌ Error fetching historical data: {e}")
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
-@api_router.get("/fetch-recent-data")
+@api_router.get("/fetch-recent-data", response_model=None)
 async def fetch_recent_gold_data(
-    hours: int = 24, capital_service: CapitalAPIService = Depends(get_capital_service)
-) -> Dict[str, Any]:
+    hours: int = 24, fetcher: GoldDataFetcher = Depends(get_fetcher)
+) -> Union[Response, Dict[str, Any]]:
     """Fetch recent gold data for specified hours"""
+    timestamp = datetime.now().isoformat()
     try:
-        from ..services.data_fetcher import GoldDataFetcher
-
-        fetcher = GoldDataFetcher(capital_service)
-        await fetcher.initialize()
+        logger.info(f"🔍 Fetching recent {hours} hours of data")
 
-        try:
-            logger.info(f"🔍 Fetching recent {hours} hours of data")
+        data = await fetcher.fetch_recent_data(hours=hours)
 
-            data = await fetcher.fetch_recent_data(hours=hours)
-
-            return {
+        return _json_response(
+            {
                 "success": True,
                 "message": f"Successfully fetched {len(data)} recent records",
                 "data_count": len(data),
                 "hours": hours,
-                "sample_data": data[-10:] if data else [],  # Return last 10 records
-                "timestamp": datetime.now().isoformat(),
+                # Return last 10 records
+                "sample_data": data[-10:] if data else [],
+                "timestamp": timestamp,
             }
-
-        finally:
-            await fetcher.cleanup()
+        )
 
     except Exception as e:
         logger.error(f"❌ Error fetching recent data: {e}")
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
-@api_router.get("/fetch-daily-data")
+@api_router.get("/fetch-daily-data", response_model=None)
 async def fetch_daily_gold_data(
-    days: int = 30, capital_service: CapitalAPIService = Depends(get_capital_service)
-) -> Dict[str, Any]:
+    days: int = 30, fetcher: GoldDataFetcher = Depends(get_fetcher)
+) -> Union[StreamingResponse, Dict[str, Any]]:
     """Fetch daily gold data"""
+    timestamp = datetime.now().isoformat()
     try:
-        from ..services.data_fetcher import GoldDataFetcher
-
-        fetcher = GoldDataFetcher(capital_service)
-        await fetcher.initialize()
+        logger.info(f"🔍 Fetching {days} days of daily data")
 
-        try:
-            logger.info(f"🔍 Fetching {days} days of daily data")
-
-            data = await fetcher.fetch_daily_data(days=days)
-
-            return {
-                "success": True,
-                "message": f"Successfully fetched {len(data)} daily records",
-                "data_count": len(data),
-                "days": days,
-                "data": data,  # Return all daily data since it's typically smaller
-                "timestamp": datetime.now().isoformat(),
-            }
-
-        finally:
-            await fetcher.cleanup()
+        # Pull the first page before committing to a 200 so that auth and
+        # connection failures still get the usual error response
+        batches = fetcher.stream_daily_data(days=days)
+        first_batch = await anext(batches, [])
 
     except Exception as e:
         logger.error(f"❌ Error fetching daily data: {e}")
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
+    async def body() -> AsyncIterator[bytes]:
+        # Records go out page by page as a JSON array; the count is only known
+        # once the array is done, so the summary fields follow it
+        data_count = 0
+        try:
+            yield b'{"success":true,"data":['
+            batch = first_batch
+            while True:
+                for record in batch:
+                    yield (b"," if data_count else b"") + orjson.dumps(record)
+                    data_count += 1
+                batch = await anext(batches, None)
+                if batch is None:
+                    break
+        finally:
+            # Stop paginating if the client went away mid-stream
+            await batches.aclose()
+
+        summary = orjson.dumps(
+            {
+                "message": f"Successfully fetched {data_count} daily records",
+                "data_count": data_count,
+                "days": days,
+                "timestamp": timestamp,
+            }
+        )
+        yield b"]," + summary[1:]
+
+    return StreamingResponse(body(), media_type="application/json")
+
 
-@api_router.post("/fetch-all-data")
+@api_router.post("/fetch-all-data", response_model=None)
 async def fetch_all_available_data(
-    capital_service: CapitalAPIService = Depends(get_capital_service),
-) -> Dict[str, Any]:
+    fetcher: GoldDataFetcher = Depends(get_fetcher),
+) -> Union[Response, Dict[str, Any]]:
     """Fetch all available historical data (use with caution!)"""
+    timestamp = datetime.now().isoformat()
     try:
-        from ..services.data_fetcher import GoldDataFetcher
+        logger.warning("⚠️ Starting full historical data fetch - this may take time")
 
-        fetcher = GoldDataFetcher(capital_service)
-        await fetcher.initialize()
+        data_count, sample_data = await _count_with_sample(
+            fetcher.stream_all_available_data(), 10
+        )
 
-        try:
-            logger.warning("⚠️ Starting full historical data fetch - this may take time")
-
-            data = await fetcher.fetch_all_available_data()
-
-            return {
+        return _json_response(
+            {
                 "success": True,
-                "message": f"Successfully fetched {len(data)} historical records",
-                "data_count": len(data),
+                "message": f"Successfully fetched {data_count} historical records",
+                "data_count": data_count,
                 "warning": "This is a large dataset - consider using pagination for client-side processing",
-                "sample_data": data[:10] if data else [],
-                "timestamp": datetime.now().isoformat(),
+                "sample_data": sample_data,
+                "timestamp": timestamp,
             }
-
-        finally:
-            await fetcher.cleanup()
+        )
 
     except Exception as e:
         logger.error(f"❌ Error fetching all data: {e}")
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
 
@@ -287,6 +322,7 @@ async def get_data_statistics(
     capital_service: CapitalAPIService = Depends(get_capital_service),
 ) -> Dict[str, Any]:
     """Get statistics about available data"""
+    timestamp = datetime.now().isoformat()
     try:
         # This would typically query your database for statistics
         # For now, we'll return API connection status
@@ -312,7 +348,7 @@ async def get_data_statistics(
                 "historical_data": "Use /fetch-historical-data with pagination",
                 "daily_summary": "Use /fetch-daily-data for daily OHLC data",
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
     except Exception as e:
@@ -320,5 +356,5 @@ async def get_data_statistics(
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
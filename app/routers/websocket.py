@@ -3,7 +3,7 @@ WebSocket router for real-time connections
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from ..dependencies import get_websocket_manager
+from ..dependencies import get_streaming_websocket_manager
 from ..services.websocket import WebSocketManager
 from ..core.logging import get_logger
 
@@ -14,7 +14,8 @@ websocket_router = APIRouter()
 
 @websocket_router.websocket("/gold-prices")
 async def websocket_endpoint(
-    websocket: WebSocket, ws_manager: WebSocketManager = Depends(get_websocket_manager)
+    websocket: WebSocket,
+    ws_manager: WebSocketManager = Depends(get_streaming_websocket_manager),
 ):
     """WebSocket endpoint for real-time gold prices"""
     connection_id = None
@@ -23,10 +24,16 @@ async def websocket_endpoint(
         # Accept connection
         connection_id = await ws_manager.connect(websocket)
 
-        # Listen for messages
+        # Listen for messages; text and binary frames are both passed on
+        # undecoded, since orjson parses either
         while True:
-            message = await websocket.receive_text()
-            await ws_manager.handle_client_message(connection_id, message)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            payload = message.get("text")
+            if payload is None:
+                payload = message.get("bytes")
+            await ws_manager.handle_client_message(connection_id, payload)
 
     except WebSocketDisconnect:
         logger.info(f"🔌 WebSocket client disconnected: {connection_id}")
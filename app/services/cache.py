@@ -0,0 +1,67 @@
+"""
+Small on-disk cache for immutable API responses
+"""
+
+import hashlib
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import aiofiles
+import aiofiles.os
+import orjson
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class DiskCache:
+    """JSON-serializable values stored one file per key, with per-entry expiry"""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing, expired or unreadable"""
+        path = self._path(key)
+        try:
+            async with aiofiles.open(path, "rb") as f:
+                entry = orjson.loads(await f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if entry.get("expires", 0) < time.time():
+            return None
+        return entry.get("value")
+
+    async def set(self, key: str, value: Any, expire: float) -> None:
+        """Store value for expire seconds"""
+        path = self._path(key)
+        # Unique per writer, so two writers of one key never share a temp file
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+        )
+        try:
+            await aiofiles.os.makedirs(path.parent, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial data
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(
+                    orjson.dumps({"expires": time.time() + expire, "value": value})
+                )
+            await aiofiles.os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write cache entry {path}: {e}")
+            try:
+                await aiofiles.os.remove(tmp_path)
+            except OSError:
+                pass
@@ -3,20 +3,50 @@ Professional Capital.com API Service with async best practices
 """
 
 import asyncio
-import json
-import uuid
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Callable, List
+import itertools
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Callable, List, Union
 import aiohttp
-import websockets
+import orjson
+from multidict import CIMultiDict, CIMultiDictProxy
+from websockets.asyncio.client import ClientConnection, connect
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
-from ..core.config import settings
+from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..models.market import PriceTick, MarketData, MarketStatus
+from .http import get_session
 
 logger = get_logger(__name__)
 
+# Price history is verbose JSON; ask for brotli when aiohttp can decode it
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Capital.com sessions expire after 10 minutes without a request; refresh a
+# little before that rather than eating a 401
+_SESSION_TTL = 540
+
+
+# The shared session allows 60s for long price-history pages; session and
+# snapshot calls keep this service's tighter limit
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+def _price_tick(bid: float, ask: float, timestamp: datetime) -> PriceTick:
+    """
+    Build a streamed tick
+
+    pydantic-core's validating __init__ is cheaper than model_construct for a
+    model this small.
+    """
+    return PriceTick(timestamp=timestamp, bid=bid, ask=ask, mid=(bid + ask) / 2)
+
 
 class CapitalAPIError(Exception):
     """Custom exception for Capital API errors"""
@@ -30,6 +60,8 @@ class CapitalAPIService:
     """
 
     def __init__(self):
+        settings = get_settings()
+
         # API Configuration
         self.api_key = settings.CAPITAL_API_KEY
         self.email = settings.CAPITAL_EMAIL
@@ -55,13 +87,36 @@ class CapitalAPIService:
         self.account_id: Optional[str] = None
         self.client_id: Optional[str] = None
 
+        # Request headers, rebuilt on every (re-)authentication
+        self._http_headers: CIMultiDictProxy[str] = CIMultiDictProxy(CIMultiDict())
+        self._ws_headers: Dict[str, str] = {}
+
         # Connection state
         self.is_authenticated = False
-        self.websocket: Optional[websockets.WebSocketServerProtocol] = None
-        self._is_streaming = False
+        self._token_expiry = 0.0
+        # Single-flight re-authentication shared by concurrent callers
+        self._reauth_lock = asyncio.Lock()
+        self._reauth_task: Optional[asyncio.Task] = None
+        self.websocket: Optional[ClientConnection] = None
+        self.is_streaming = False
+        self._active_epic: Optional[str] = None
+        self._correlation_ids = itertools.count(1)
 
         # Callbacks
         self.price_callback: Optional[Callable[[PriceTick], None]] = None
+        self._callback_is_coro = False
+
+        # Handlers for inbound streaming messages, keyed by destination
+        self._message_handlers = {
+            "quote": self._on_quote,
+            "marketData.subscribe": self._on_subscribe,
+            "ping": self._on_ping,
+        }
+
+        # (bid, ask) quotes are handed from the receive loop to a dispatch
+        # worker, so a slow callback never holds up reading the socket
+        self._tick_queue: Optional[asyncio.Queue] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
 
         # Session
         self.session: Optional[aiohttp.ClientSession] = None
@@ -79,9 +134,9 @@ class CapitalAPIService:
         """Initialize the service"""
         logger.info("🚀 Initializing Capital.com API service")
 
-        # Create aiohttp session
-        timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        # Same process-wide session as the data fetcher, so authentication,
+        # snapshots and history pages reuse one set of warm TLS connections
+        self.session = await get_session()
 
         # Authenticate
         await self.authenticate()
@@ -96,13 +151,17 @@ class CapitalAPIService:
         if self.is_streaming:
             await self.stop_streaming()
 
+        # Stop the tick dispatcher
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
+
         # Close websocket
         if self.websocket:
             await self.websocket.close()
 
-        # Close HTTP session
-        if self.session:
-            await self.session.close()
+        # The shared HTTP session is closed by close_session() at shutdown
+        self.session = None
 
         logger.info("✅ Capital.com API service cleanup completed")
 
@@ -123,7 +182,10 @@ class CapitalAPIService:
             logger.info("🔐 Authenticating with Capital.com API")
 
             async with self.session.post(
-                f"{self.base_url}/api/v1/session", headers=headers, json=payload
+                f"{self.base_url}/api/v1/session",
+                headers=headers,
+                data=orjson.dumps(payload),
+                timeout=_REQUEST_TIMEOUT,
             ) as response:
 
                 if response.status != 200:
@@ -139,12 +201,30 @@ class CapitalAPIService:
                 if not self.session_token or not self.security_token:
                     raise CapitalAPIError("Missing authentication tokens in response")
 
+                # Read-only, since every request shares this one instance
+                self._http_headers = CIMultiDictProxy(
+                    CIMultiDict(
+                        {
+                            "X-CAP-API-KEY": self.api_key,
+                            "CST": self.session_token,
+                            "X-SECURITY-TOKEN": self.security_token,
+                            "Version": "1",
+                            "Accept-Encoding": _ACCEPT_ENCODING,
+                        }
+                    )
+                )
+                self._ws_headers = {
+                    "CST": self.session_token,
+                    "X-SECURITY-TOKEN": self.security_token,
+                }
+
                 # Get account info from response body
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 self.account_id = str(data.get("accountId"))
                 self.client_id = str(data.get("clientId"))
 
                 self.is_authenticated = True
+                self._token_expiry = time.monotonic() + _SESSION_TTL
 
                 logger.info("✅ Authentication successful")
                 logger.info(f"📊 Account ID: {self.account_id}")
@@ -159,51 +239,103 @@ class CapitalAPIService:
             logger.error(f"❌ Unexpected error during authentication: {e}")
             raise CapitalAPIError(f"Authentication error: {e}")
 
+    def get_headers(self) -> CIMultiDictProxy:
+        """
+        REST headers for the current session
+
+        The same read-only instance is returned until the next authentication
+        replaces it, so callers should fetch it again after re-authenticating.
+        """
+        return self._http_headers
+
+    def mark_session_active(self) -> None:
+        """Push back the session expiry after a successful authenticated request"""
+        self._token_expiry = time.monotonic() + _SESSION_TTL
+
+    async def reauth_once(self, stale_token: Optional[str] = None) -> bool:
+        """
+        Re-authenticate after a 401, sharing one login between concurrent callers
+
+        Callers that arrive while a login is in flight wait for it instead of
+        starting their own. Pass the CST the failed request used as
+        stale_token; if the session has already been renewed since, no new
+        login is made.
+        """
+        async with self._reauth_lock:
+            if stale_token is not None and self.session_token != stale_token:
+                return self.is_authenticated
+            if self._reauth_task is None or self._reauth_task.done():
+                self._reauth_task = asyncio.create_task(self.authenticate())
+            task = self._reauth_task
+
+        # Shield so a cancelled caller does not cancel the login for everyone
+        return await asyncio.shield(task)
+
+    async def _fetch_snapshot(self, epic: str) -> Optional[Dict[str, Any]]:
+        """Fetch the raw /markets/{epic} body (market info plus price snapshot)"""
+        if not self.is_authenticated or time.monotonic() >= self._token_expiry:
+            # Single-flight, so concurrent callers past the TTL share one login
+            # (session_token is None before the first login)
+            await self.reauth_once(self.session_token)
+
+        url = f"{self.base_url}/api/v1/markets/{epic}"
+
+        try:
+            for attempt in range(2):
+                stale_token = self.session_token
+                async with self.session.get(
+                    url, headers=self._http_headers, timeout=_REQUEST_TIMEOUT
+                ) as response:
+                    status = response.status
+                    if status == 200:
+                        # Any authenticated request keeps the session alive
+                        self.mark_session_active()
+                        return orjson.loads(await response.read())
+
+                if status == 401 and attempt == 0:
+                    logger.warning("🔐 Authentication expired, re-authenticating...")
+                    await self.reauth_once(stale_token)
+                    continue
+
+                logger.error(f"❌ Failed to get market data: {status}")
+                return None
+
+        except Exception as e:
+            logger.error(f"❌ Error getting market data: {e}")
+            return None
+
     async def get_market_data(
         self, epic: str = "CS.D.CFEGOLD.CFE.IP"
     ) -> Optional[MarketData]:
         """Get current market data for gold"""
-        if not self.is_authenticated:
-            await self.authenticate()
-
-        headers = {
-            "X-CAP-API-KEY": self.api_key,
-            "CST": self.session_token,
-            "X-SECURITY-TOKEN": self.security_token,
-            "Version": "1",
-        }
+        data = await self._fetch_snapshot(epic)
+        if data is None:
+            return None
 
         try:
-            async with self.session.get(
-                f"{self.base_url}/api/v1/markets/{epic}", headers=headers
-            ) as response:
-
-                if response.status != 200:
-                    logger.error(f"❌ Failed to get market data: {response.status}")
-                    return None
-
-                data = await response.json()
-                market_info = data.get("market", {})
-                snapshot = data.get("snapshot", {})
-
-                return MarketData(
-                    symbol="XAU/USD",
-                    current_price=float(snapshot.get("offer", 0)),
-                    bid=float(snapshot.get("bid", 0)),
-                    ask=float(snapshot.get("offer", 0)),
-                    spread=float(snapshot.get("offer", 0))
-                    - float(snapshot.get("bid", 0)),
-                    high_24h=float(snapshot.get("high", 0)),
-                    low_24h=float(snapshot.get("low", 0)),
-                    change_24h=float(snapshot.get("netChange", 0)),
-                    change_percent_24h=float(snapshot.get("percentageChange", 0)),
-                    last_update=datetime.now(),
-                    market_status=(
-                        MarketStatus.OPEN
-                        if market_info.get("marketStatus") == "TRADEABLE"
-                        else MarketStatus.CLOSED
-                    ),
-                )
+            market_info = data.get("market", {})
+            snapshot = data.get("snapshot", {})
+
+            bid = float(snapshot.get("bid", 0))
+            ask = float(snapshot.get("offer", 0))
+
+            return MarketData(
+                symbol="XAU/USD",
+                current_price=ask,
+                bid=bid,
+                ask=ask,
+                spread=ask - bid,
+                high_24h=float(snapshot.get("high", 0)),
+                low_24h=float(snapshot.get("low", 0)),
+                change_24h=float(snapshot.get("netChange", 0)),
+                change_percent_24h=float(snapshot.get("percentageChange", 0)),
+                last_update=datetime.now(),
+                market_status=(
+                    MarketStatus.OPEN
+                    if market_info.get("marketStatus") == "TRADEABLE"
+                    else MarketStatus.CLOSED
+                ),
+            )
 
         except Exception as e:
             logger.error(f"❌ Error getting market data: {e}")
@@ -211,16 +343,21 @@ class CapitalAPIService:
 
     async def get_current_price(self, symbol: str = "GOLD") -> Optional[PriceTick]:
         """Get current price for a symbol"""
-        market_data = await self.get_market_data(symbol)
-        if market_data:
-            return PriceTick(
-                timestamp=market_data.last_update,
-                bid=market_data.bid,
-                ask=market_data.ask,
-                mid=market_data.current_price,
-                volume=None,
-            )
-        return None
+        data = await self._fetch_snapshot(symbol)
+        if data is None:
+            return None
+
+        # Only bid/offer are needed, so skip building a full MarketData
+        try:
+            snapshot = data.get("snapshot", {})
+            bid = float(snapshot.get("bid", 0))
+            ask = float(snapshot.get("offer", 0))
+
+            return PriceTick(timestamp=datetime.now(), bid=bid, ask=ask, mid=ask)
+
+        except Exception as e:
+            logger.error(f"❌ Error getting current price: {e}")
+            return None
 
     async def get_market_info(self, symbol: str = "GOLD") -> Optional[MarketData]:
         """Get market information for a symbol"""
@@ -229,22 +366,14 @@ class CapitalAPIService:
     def add_price_callback(self, callback: Callable[[PriceTick], None]) -> None:
         """Add a price callback function"""
         self.price_callback = callback
+        # Resolved once here rather than on every tick
+        self._callback_is_coro = asyncio.iscoroutinefunction(callback)
 
     @property
     def is_connected(self) -> bool:
         """Check if the service is connected"""
         return self.is_authenticated
 
-    @property
-    def is_streaming(self) -> bool:
-        """Check if streaming is active"""
-        return self._is_streaming
-
-    @is_streaming.setter
-    def is_streaming(self, value: bool) -> None:
-        """Set streaming status"""
-        self._is_streaming = value
-
     async def start_streaming(
         self, price_callback: Callable[[PriceTick], None]
     ) -> None:
@@ -252,13 +381,18 @@ class CapitalAPIService:
         if not self.is_authenticated:
             await self.authenticate()
 
-        self.price_callback = price_callback
+        self.add_price_callback(price_callback)
+
+        if self._dispatch_task is None:
+            self._tick_queue = asyncio.Queue(maxsize=1024)
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
 
         # Start streaming in background task
         asyncio.create_task(self._streaming_loop())
 
     async def _streaming_loop(self) -> None:
         """Main streaming loop with reconnection logic"""
+        settings = get_settings()
         max_retries = 5
         retry_delay = 1
 
@@ -268,41 +402,42 @@ class CapitalAPIService:
                     f"🔗 Starting WebSocket connection (attempt {attempt + 1}/{max_retries})"
                 )
 
-                headers = {
-                    "CST": self.session_token,
-                    "X-SECURITY-TOKEN": self.security_token,
-                }
-
-                async with websockets.connect(
+                # Quote frames are tiny, so permessage-deflate costs more CPU
+                # than it saves on the wire
+                async with connect(
                     f"{self.websocket_url}/connect",
-                    additional_headers=headers,
+                    additional_headers=self._ws_headers,
+                    compression=None,
+                    max_size=2**20,
                     ping_interval=settings.WEBSOCKET_PING_INTERVAL,
                     ping_timeout=settings.WEBSOCKET_PING_TIMEOUT,
                 ) as websocket:
 
                     self.websocket = websocket
-                    self._is_streaming = True
+                    self.is_streaming = True
 
                     # Subscribe to gold prices
                     await self._subscribe_to_gold()
 
                     logger.info("✅ WebSocket streaming started successfully")
 
-                    # Listen for messages
-                    async for message in websocket:
+                    # Listen for messages; take raw frames and let orjson do the
+                    # UTF-8 check instead of decoding every frame to str first
+                    while True:
+                        message = await websocket.recv(decode=False)
                         await self._handle_websocket_message(message)
 
             except ConnectionClosed:
                 logger.warning("🔌 WebSocket connection closed")
-                self._is_streaming = False
+                self.is_streaming = False
 
             except WebSocketException as e:
                 logger.error(f"❌ WebSocket error: {e}")
-                self._is_streaming = False
+                self.is_streaming = False
 
             except Exception as e:
                 logger.error(f"❌ Unexpected streaming error: {e}")
-                self._is_streaming = False
+                self.is_streaming = False
 
             # Exponential backoff
             if attempt < max_retries - 1:
@@ -314,106 +449,134 @@ class CapitalAPIService:
 
     async def _subscribe_to_gold(self) -> None:
         """Subscribe to gold price updates"""
-        # Try different possible GOLD epics
+        # Try different possible GOLD epics, all in one request
         gold_epics = ["GOLD", "CS.D.CFEGOLD.CFE.IP", "XAU/USD", "XAUUSD"]
 
-        for epic in gold_epics:
-            subscription = {
-                "destination": "marketData.subscribe",
-                "correlationId": str(uuid.uuid4()),
-                "cst": self.session_token,
-                "securityToken": self.security_token,
-                "payload": {"epics": [epic]},
-            }
+        subscription = {
+            "destination": "marketData.subscribe",
+            "correlationId": str(next(self._correlation_ids)),
+            "cst": self.session_token,
+            "securityToken": self.security_token,
+            "payload": {"epics": gold_epics},
+        }
 
-            try:
-                await self.websocket.send(json.dumps(subscription))
-                logger.info(f"📡 Subscription request sent for {epic}")
-
-                # Wait for response with timeout
-                response = await asyncio.wait_for(self.websocket.recv(), timeout=5)
-                response_data = json.loads(response)
-
-                if (
-                    response_data.get("status") == "OK"
-                    and response_data.get("destination") == "marketData.subscribe"
-                ):
-                    subscriptions = response_data.get("payload", {}).get("subscriptions", {})
-                    if epic in subscriptions and subscriptions[epic] == "PROCESSED":
+        try:
+            # Decoded so it still goes out as a text frame
+            await self.websocket.send(orjson.dumps(subscription).decode())
+            logger.info(f"📡 Subscription request sent for {gold_epics}")
+
+            # Wait for response with timeout
+            response = await asyncio.wait_for(
+                self.websocket.recv(decode=False), timeout=5
+            )
+            response_data = orjson.loads(response)
+
+            if (
+                response_data.get("status") == "OK"
+                and response_data.get("destination") == "marketData.subscribe"
+            ):
+                subscriptions = response_data.get("payload", {}).get("subscriptions", {})
+                # Epics are listed in order of preference
+                for epic in gold_epics:
+                    if subscriptions.get(epic) == "PROCESSED":
+                        self._active_epic = epic
                         logger.info(f"✅ Successfully subscribed to {epic}")
                         return
-                    else:
-                        logger.warning(f"❌ Failed to subscribe to {epic}: {subscriptions}")
-                else:
-                    logger.warning(f"❌ Subscription response error for {epic}: {response_data}")
+                logger.warning(f"❌ Failed to subscribe to gold epics: {subscriptions}")
+            else:
+                logger.warning(f"❌ Subscription response error: {response_data}")
 
-            except Exception as e:
-                logger.error(f"❌ Error subscribing to {epic}: {e}")
-                continue
+        except Exception as e:
+            logger.error(f"❌ Error subscribing to gold epics: {e}")
 
         logger.error("❌ Failed to subscribe to any GOLD epic")
 
-    async def _handle_websocket_message(self, message: str) -> None:
+    async def _handle_websocket_message(self, message: Union[str, bytes]) -> None:
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(message)
-            destination = data.get("destination")
-            status = data.get("status")
-
-            if destination == "marketData.subscribe":
-                # Handle subscription response
-                if status == "OK":
-                    subscriptions = data.get("payload", {}).get("subscriptions", {})
-                    logger.info(f"📊 Subscription status: {subscriptions}")
-                else:
-                    logger.error(f"❌ Subscription failed: {data}")
-
-            elif destination == "quote":
-                # Handle price updates
-                payload = data.get("payload", {})
-                epic = payload.get("epic")
-
-                # Process price data
-                bid = payload.get("bid")
-                ask = payload.get("ofr")  # Capital.com uses "ofr" for ask
-
-                if bid and ask:
-                    # Create price tick
-                    price_tick = PriceTick(
-                        timestamp=datetime.now(),
-                        bid=float(bid),
-                        ask=float(ask),
-                        mid=(float(bid) + float(ask)) / 2,
-                        volume=None,
-                    )
-
-                    logger.info(
-                        f"💰 Real-time Gold Price: Bid=${bid}, Ask=${ask}, Mid=${price_tick.mid}"
-                    )
-
-                    # Call callback
-                    if self.price_callback:
-                        await self._safe_callback(price_tick)
-
-            elif destination == "ping":
-                # Handle ping response
-                if status == "OK":
-                    logger.info("🏓 Ping response received")
-                else:
-                    logger.warning(f"❌ Ping failed: {data}")
-
+            data = orjson.loads(message)
+            handler = self._message_handlers.get(data.get("destination"))
+            if handler is not None:
+                await handler(data)
             else:
                 logger.debug(f"🔍 Unknown WebSocket message: {data}")
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"⚠️ Invalid JSON message: {message}")
         except Exception as e:
             logger.error(f"❌ Error processing WebSocket message: {e}")
 
+    async def _on_subscribe(self, data: Dict[str, Any]) -> None:
+        """Handle subscription response"""
+        if data.get("status") == "OK":
+            subscriptions = data.get("payload", {}).get("subscriptions", {})
+            logger.info(f"📊 Subscription status: {subscriptions}")
+        else:
+            logger.error(f"❌ Subscription failed: {data}")
+
+    async def _on_quote(self, data: Dict[str, Any]) -> None:
+        """Handle price updates"""
+        payload = data.get("payload", {})
+
+        # Process price data
+        bid = payload.get("bid")
+        ask = payload.get("ofr")  # Capital.com uses "ofr" for ask
+
+        if bid and ask:
+            # orjson already yields floats for JSON numbers; this only
+            # normalises the odd int or string quote
+            bid = float(bid)
+            ask = float(ask)
+
+            # Per-tick, so debug level with lazy %-formatting
+            logger.debug(
+                "💰 Real-time Gold Price: Bid=$%s, Ask=$%s, Mid=$%s",
+                bid,
+                ask,
+                (bid + ask) / 2,
+            )
+
+            # Call callback; queued quotes are stamped by the dispatch worker
+            if self.price_callback:
+                if self._tick_queue is None:
+                    await self._safe_callback(
+                        _price_tick(bid, ask, datetime.now(timezone.utc))
+                    )
+                else:
+                    self._enqueue_quote(bid, ask)
+
+    async def _on_ping(self, data: Dict[str, Any]) -> None:
+        """Handle ping response"""
+        if data.get("status") == "OK":
+            logger.info("🏓 Ping response received")
+        else:
+            logger.warning(f"❌ Ping failed: {data}")
+
+    def _enqueue_quote(self, bid: float, ask: float) -> None:
+        """Queue a quote for dispatch, dropping the oldest one if the queue is full"""
+        if self._tick_queue.full():
+            self._tick_queue.get_nowait()
+        self._tick_queue.put_nowait((bid, ask))
+
+    async def _dispatch_loop(self) -> None:
+        """Feed queued quotes to the price callback, a burst at a time"""
+        queue = self._tick_queue
+        while True:
+            burst = [await queue.get()]
+            while not queue.empty():
+                burst.append(queue.get_nowait())
+
+            # A burst arrives within a few ms, so one clock read stamps it all
+            received_at = datetime.now(timezone.utc)
+
+            # In order, not gathered: subscribers must see ticks in sequence
+            for bid, ask in burst:
+                await self._safe_callback(_price_tick(bid, ask, received_at))
+
     async def _safe_callback(self, price_tick: PriceTick) -> None:
         """Safely execute price callback"""
         try:
-            if asyncio.iscoroutinefunction(self.price_callback):
+            if self._callback_is_coro:
                 await self.price_callback(price_tick)
             else:
                 self.price_callback(price_tick)
@@ -422,8 +585,9 @@ class CapitalAPIService:
 
     async def stop_streaming(self) -> None:
         """Stop WebSocket streaming"""
-        if self.websocket and not self.websocket.closed:
+        # close() is a no-op on an already closed connection
+        if self.websocket:
             await self.websocket.close()
 
-        self._is_streaming = False
+        self.is_streaming = False
         logger.info("🛑 WebSocket streaming stopped")
@@ -3,38 +3,100 @@ Gold Data Fetcher Service - Fetches historical data via API pagination
 """
 
 import asyncio
-import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 import aiohttp
-from ..core.config import settings
+import orjson
+from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..models.market import PriceTick, MarketData
+from .cache import DiskCache
+from .http import get_session
+from .rate_limiter import Backpressure, RateLimiter, retry_after_seconds
+from .sinks import JSONLSink
 
 logger = get_logger(__name__)
 
+# Minute windows that ended this long ago are final and can be cached for long
+_SETTLED_AFTER = timedelta(days=1)
+_SETTLED_CACHE_TTL = 30 * 24 * 3600
+_RECENT_CACHE_TTL = 60
+
+# Request window per resolution, small enough to stay inside API limits
+_WINDOW_SIZES = {
+    "MINUTE": timedelta(hours=1),
+    "MINUTE_5": timedelta(hours=1),
+    "HOUR": timedelta(hours=12),
+}
+_DEFAULT_WINDOW = timedelta(days=7)
+
+# Snapshot times remembered per fetch to drop records repeated across pages;
+# only page boundaries overlap, so the most recent ones are enough
+_SEEN_LIMIT = 10_000
+
+# Per-page detail is logged at DEBUG; INFO gets a summary every N pages
+_PROGRESS_EVERY = 10
+
+
+def _parse_capital_ts(value: str) -> datetime:
+    """Parse a Capital.com timestamp, with or without a trailing Z"""
+    if value[-1] == "Z":
+        # fromisoformat only accepts the Z suffix from Python 3.11
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _snapshot_key(price: Dict[str, Any]) -> str:
+    """Sort key for a raw price record: its UTC snapshot time string"""
+    return price.get("snapshotTimeUTC", price.get("snapshotTime", "9999-12-31"))
+
+
+def _window_schedule(
+    from_date: datetime, to_date: datetime, resolution: str
+) -> List[Tuple[datetime, datetime]]:
+    """Split [from_date, to_date] into request windows, newest first"""
+    size = _WINDOW_SIZES.get(resolution, _DEFAULT_WINDOW)
+    windows = []
+    window_to = to_date
+    while window_to > from_date:
+        window_from = max(from_date, window_to - size)
+        windows.append((window_from, window_to))
+        # Step back one second so consecutive windows never overlap
+        window_to = window_from - timedelta(seconds=1)
+    return windows
+
 
 class GoldDataFetcher:
     """Service to fetch historical gold data using API pagination"""
 
-    def __init__(self, capital_service):
+    def __init__(self, capital_service, keep_raw: bool = False):
         self.capital_service = capital_service
+        # Attach the untouched API record to each processed one (debugging aid;
+        # roughly doubles the memory held per record)
+        self.keep_raw = keep_raw
         self.session: Optional[aiohttp.ClientSession] = None
 
+        # Request pacing shared by every fetch made through this instance
+        settings = get_settings()
+        self.rate_limiter = RateLimiter(settings.FETCH_REQUESTS_PER_MINUTE)
+        self.backpressure = Backpressure(maximum=settings.FETCH_CONCURRENCY)
+        self.cache = DiskCache(settings.FETCH_CACHE_DIR)
+
     async def initialize(self) -> None:
         """Initialize the data fetcher"""
         logger.info("🚀 Initializing Gold Data Fetcher")
 
-        # Create aiohttp session
-        timeout = aiohttp.ClientTimeout(total=60)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        # Pagination and concurrent day batches all hit the same host, so use
+        # the process-wide session and its warm connections
+        self.session = await get_session()
 
         logger.info("✅ Gold Data Fetcher initialized")
 
     async def cleanup(self) -> None:
         """Cleanup resources"""
-        if self.session:
-            await self.session.close()
+        # The shared session is closed at shutdown via http.close_session()
+        self.session = None
         logger.info("✅ Gold Data Fetcher cleanup completed")
 
     async def fetch_historical_prices(
@@ -58,26 +120,79 @@ class GoldDataFetcher:
         Returns:
             List of price data dictionaries
         """
-        # Try different possible GOLD epics if none specified
-        if epic is None:
-            gold_epics = ["GOLD"]  # Use the working epic first
-            for test_epic in gold_epics:
-                logger.info(f"🔍 Trying epic: {test_epic}")
-                result = await self._fetch_for_epic(
-                    test_epic, resolution, max_pages, from_date, to_date
-                )
-                if result:
-                    logger.info(f"✅ Successfully found data for epic: {test_epic}")
-                    return result
-                else:
-                    logger.warning(f"❌ No data found for epic: {test_epic}")
-
-            logger.error("❌ No valid gold epic found")
-            return []
-        else:
-            return await self._fetch_for_epic(
+        return await self._collect(
+            self.stream_historical_prices(
                 epic, resolution, max_pages, from_date, to_date
             )
+        )
+
+    async def stream_historical_prices(
+        self,
+        epic: Optional[str] = None,
+        resolution: str = "MINUTE_5",
+        max_pages: int = 100,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Like fetch_historical_prices, but yield each processed page as it arrives
+        so callers only hold one page in memory at a time
+        """
+        if epic is not None:
+            async for batch in self._fetch_for_epic(
+                epic, resolution, max_pages, from_date, to_date
+            ):
+                yield batch
+            return
+
+        # Try different possible GOLD epics if none specified
+        gold_epics = ["GOLD"]  # Use the working epic first
+        for test_epic in gold_epics:
+            logger.info(f"🔍 Trying epic: {test_epic}")
+            found = False
+            async for batch in self._fetch_for_epic(
+                test_epic, resolution, max_pages, from_date, to_date
+            ):
+                found = found or bool(batch)
+                yield batch
+            if found:
+                logger.info(f"✅ Successfully found data for epic: {test_epic}")
+                return
+            logger.warning(f"❌ No data found for epic: {test_epic}")
+
+        logger.error("❌ No valid gold epic found")
+
+    async def export_historical_prices(
+        self,
+        sink: JSONLSink,
+        epic: Optional[str] = None,
+        resolution: str = "MINUTE_5",
+        max_pages: int = 100,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Like fetch_historical_prices, but write each page to sink as it arrives
+        instead of returning everything, so memory stays at one page
+
+        Returns:
+            The sink's stats (path, rows, batches)
+        """
+        async for batch in self.stream_historical_prices(
+            epic, resolution, max_pages, from_date, to_date
+        ):
+            await sink.write_batch(batch)
+        return sink.stats()
+
+    @staticmethod
+    async def _collect(
+        batches: AsyncIterator[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Drain a batch stream into a single list"""
+        all_prices: List[Dict[str, Any]] = []
+        async for batch in batches:
+            all_prices.extend(batch)
+        return all_prices
 
     async def _fetch_for_epic(
         self,
@@ -86,9 +201,9 @@ class GoldDataFetcher:
         max_pages: int,
         from_date: Optional[datetime],
         to_date: Optional[datetime],
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
         """
-        Fetch historical prices for a specific epic
+        Fetch historical prices for a specific epic, one processed page at a time
         """
         logger.info(f"📊 Starting historical data fetch for {epic}")
         logger.info(f"🔍 Resolution: {resolution}, Max pages: {max_pages}")
@@ -97,7 +212,7 @@ class GoldDataFetcher:
         if not self.capital_service.is_authenticated:
             await self.capital_service.authenticate()
 
-        all_prices = []
+        total_records = 0
 
         # Adjust page size based on resolution to avoid API limits
         if resolution in ["MINUTE", "MINUTE_5"]:
@@ -107,218 +222,195 @@ class GoldDataFetcher:
         else:
             page_size = 1000  # Default for other resolutions
 
-        current_page = 0
-
-        # Set default date range if not provided - use VERY small ranges to avoid API limits
+        # Set default date range if not provided - one window's worth of data
         if not to_date:
             to_date = datetime.now() - timedelta(days=30)  # Go back 30 days
         if not from_date:
-            # Use very small ranges to avoid API limits - max 1 hour at a time
-            if resolution in ["MINUTE", "MINUTE_5"]:
-                from_date = to_date - timedelta(hours=1)  # 1 hour max for minute data
-            elif resolution == "HOUR":
-                from_date = to_date - timedelta(hours=12)  # 12 hours for hour data
-            else:
-                from_date = to_date - timedelta(days=7)  # 7 days for daily data
+            from_date = to_date - _WINDOW_SIZES.get(resolution, _DEFAULT_WINDOW)
 
         logger.info(f"📅 Date range: {from_date.isoformat()} to {to_date.isoformat()}")
 
-        headers = {
-            "X-CAP-API-KEY": self.capital_service.api_key,
-            "CST": self.capital_service.session_token,
-            "X-SECURITY-TOKEN": self.capital_service.security_token,
-            "Version": "1",
+        headers = self.capital_service.get_headers()
+
+        # URL and params are fixed for the whole run; only the window moves
+        url = f"{self.capital_service.base_url}/api/v1/prices/{epic}"
+        params = {
+            "resolution": resolution,
+            "from": "",
+            "to": "",
+            "max": page_size,  # Use 'max' instead of pageSize
         }
 
-        current_from = from_date
-        current_to = to_date
+        # Walk the range newest-first in windows small enough for the API
+        windows = _window_schedule(from_date, to_date, resolution)
+        window_index = 0
         page_num = 0
-
-        while page_num < max_pages and current_from < current_to:
+        throttled_retries = 0
+        auth_retries = 0
+        # How pages are ordered, checked once on the first full page:
+        # "asc", "desc" or "unsorted" (fall back to scanning each page)
+        page_order: Optional[str] = None
+        seen: "OrderedDict[str, None]" = OrderedDict()
+
+        while page_num < max_pages and window_index < len(windows):
+            current_from, current_to = windows[window_index]
             try:
                 # Use the working date format: %Y-%m-%dT%H:%M:%S (no .000Z)
                 from_timestamp = current_from.strftime("%Y-%m-%dT%H:%M:%S")
                 to_timestamp = current_to.strftime("%Y-%m-%dT%H:%M:%S")
+                params["from"] = from_timestamp
+                params["to"] = to_timestamp
+
+                logger.debug(
+                    "📡 Fetching page %d/%d for %s: %s to %s",
+                    page_num + 1,
+                    max_pages,
+                    epic,
+                    from_timestamp,
+                    to_timestamp,
+                )
 
-                # Build URL for historical prices
-                url = f"{self.capital_service.base_url}/api/v1/prices/{epic}"
-                params = {
-                    "resolution": resolution,
-                    "from": from_timestamp,
-                    "to": to_timestamp,
-                    "max": page_size,  # Use 'max' instead of pageSize
-                }
-
-                logger.info(f"📡 Fetching page {page_num + 1}/{max_pages} for {epic}")
-                logger.info(f"📅 Date range: {from_timestamp} to {to_timestamp}")
-                logger.debug(f"🔗 URL: {url}")
-                logger.debug(f"📋 Params: {params}")
-
+                await self.rate_limiter.acquire()
                 async with self.session.get(
                     url, headers=headers, params=params
                 ) as response:
-                    if response.status == 401:
+                    if response.status == 429 and throttled_retries < 3:
+                        throttled_retries += 1
+                        self._on_throttled(response)
+                        continue
+
+                    if response.status == 401 and auth_retries < 2:
+                        auth_retries += 1
+                        self.backpressure.on_error()
                         logger.warning(
                             "🔐 Authentication expired, re-authenticating..."
                         )
-                        await self.capital_service.authenticate()
-                        headers.update(
-                            {
-                                "CST": self.capital_service.session_token,
-                                "X-SECURITY-TOKEN": self.capital_service.security_token,
-                            }
-                        )
+                        await self.capital_service.reauth_once(headers["CST"])
+                        headers = self.capital_service.get_headers()
                         continue
 
                     if response.status != 200:
+                        if response.status >= 500:
+                            self.backpressure.on_error()
                         error_text = await response.text()
                         logger.error(
                             f"❌ API request failed for {epic}: {response.status} - {error_text}"
                         )
                         break
 
-                    data = await response.json()
+                    self.backpressure.on_success()
+                    self.capital_service.mark_session_active()
+                    throttled_retries = 0
+                    auth_retries = 0
+                    data = orjson.loads(await response.read())
 
                     # Extract prices from response
                     prices = data.get("prices", [])
-                    if not prices:
+                    page_num += 1
+                    if page_num % _PROGRESS_EVERY == 0:
                         logger.info(
-                            f"📭 No more data on page {page_num + 1} for {epic}"
+                            f"📈 {epic}: {page_num}/{max_pages} pages, {total_records} records so far"
                         )
-                        break
 
-                    logger.info(
-                        f"✅ Retrieved {len(prices)} price records from page {page_num + 1} for {epic}"
+                    if not prices:
+                        # Gaps (weekends, holidays) are normal; move on
+                        logger.debug("📭 No data on page %d for %s", page_num, epic)
+                        window_index += 1
+                        continue
+
+                    logger.debug(
+                        "✅ Retrieved %d price records from page %d for %s",
+                        len(prices),
+                        page_num,
+                        epic,
                     )
 
                     # Process and store prices
-                    processed_prices = self._process_price_data(prices, epic)
-                    all_prices.extend(processed_prices)
+                    processed_prices = self._process_price_data(prices, epic, seen)
+                    total_records += len(processed_prices)
+                    yield processed_prices
 
-                    # Check if we got less than expected (indicates we got all available data)
+                    # A short page means the window is complete
                     if len(prices) < page_size:
-                        logger.info("📄 Reached last page of data")
-                        break
+                        window_index += 1
+                        continue
 
-                    # Update date range for next page (go further back in time)
-                    # Find the oldest timestamp in current batch to avoid overlaps
-                    oldest_time = min(
-                        prices,
-                        key=lambda x: x.get(
-                            "snapshotTimeUTC", x.get("snapshotTime", "9999-12-31")
-                        ),
-                    )
-                    oldest_dt = datetime.fromisoformat(
+                    # A full page may have cut the window short: fetch the rest
+                    # of it, up to and including the oldest record's second
+                    # (records already received are dropped via seen)
+                    if page_order is None:
+                        keys = [_snapshot_key(price) for price in prices]
+                        if keys == sorted(keys):
+                            page_order = "asc"
+                        elif keys == sorted(keys, reverse=True):
+                            page_order = "desc"
+                        else:
+                            page_order = "unsorted"
+                            logger.warning(
+                                f"⚠️ Prices for {epic} are not in time order; scanning each page"
+                            )
+
+                    if page_order == "asc":
+                        oldest_time = prices[0]
+                    elif page_order == "desc":
+                        oldest_time = prices[-1]
+                    else:
+                        oldest_time = min(prices, key=_snapshot_key)
+                    oldest_dt = _parse_capital_ts(
                         oldest_time.get(
                             "snapshotTimeUTC", oldest_time.get("snapshotTime", "")
-                        ).replace("Z", "")
-                    )
-
-                    # Move the current_to to just before the oldest record
-                    current_to = oldest_dt - timedelta(seconds=1)
-
-                    # If we're going back too far, calculate a new from_date (use very small windows)
-                    if resolution in ["MINUTE", "MINUTE_5"]:
-                        current_from = current_to - timedelta(
-                            hours=1
-                        )  # 1 hour windows for minute data
-                    elif resolution == "HOUR":
-                        current_from = current_to - timedelta(
-                            hours=12
-                        )  # 12 hour windows for hour data
+                        )
+                    ).replace(tzinfo=None)
+                    remaining_to = oldest_dt
+                    if current_from < remaining_to < current_to:
+                        windows[window_index] = (current_from, remaining_to)
                     else:
-                        current_from = current_to - timedelta(
-                            days=7
-                        )  # 7 days for daily data
-
-                    page_num += 1
-
-                    # Rate limiting - be nice to the API
-                    await asyncio.sleep(0.2)
+                        window_index += 1
 
             except Exception as e:
                 logger.error(f"❌ Error fetching page {page_num + 1} for {epic}: {e}")
                 break
 
         logger.info(
-            f"🎯 Fetching completed for {epic}! Total records: {len(all_prices)}"
+            f"🎯 Fetching completed for {epic}! Total records: {total_records}"
         )
-        return all_prices
+
+    def _on_throttled(self, response: aiohttp.ClientResponse) -> None:
+        """React to a 429: shrink concurrency and pause requests for Retry-After"""
+        delay = retry_after_seconds(response.headers.get("Retry-After"))
+        logger.warning(f"🚦 Rate limited by API, pausing requests for {delay}s")
+        self.backpressure.on_error()
+        self.rate_limiter.defer(delay)
 
     def _process_price_data(
-        self, prices: List[Dict], epic: str
+        self,
+        prices: List[Dict],
+        epic: str,
+        seen: Optional["OrderedDict[str, None]"] = None,
     ) -> List[Dict[str, Any]]:
-        """Process raw price data from API"""
+        """
+        Process raw price data from API
+
+        Runs inline on the event loop: a 500-record page takes about 1 ms,
+        less than it costs to pickle the page to a worker process and back.
+
+        If seen is given, records whose snapshotTime is already in it are
+        skipped and new ones are added (keeping at most _SEEN_LIMIT).
+        """
         processed = []
 
         for price_data in prices:
             try:
-                # Extract OHLC data
-                open_price = price_data.get("openPrice", {})
-                high_price = price_data.get("highPrice", {})
-                low_price = price_data.get("lowPrice", {})
-                close_price = price_data.get("closePrice", {})
-
-                # Get bid/ask values
-                open_bid = open_price.get("bid")
-                open_ask = open_price.get("ask", open_price.get("offer"))
-
-                high_bid = high_price.get("bid")
-                high_ask = high_price.get("ask", high_price.get("offer"))
-
-                low_bid = low_price.get("bid")
-                low_ask = low_price.get("ask", low_price.get("offer"))
-
-                close_bid = close_price.get("bid")
-                close_ask = close_price.get("ask", close_price.get("offer"))
-
-                # Get timestamp
-                snapshot_time = price_data.get("snapshotTime")
-                if not snapshot_time:
-                    logger.debug(f"⚠️ No snapshotTime in record: {price_data}")
-                    continue  # Skip records without timestamp
-
-                timestamp = (
-                    datetime.fromisoformat(snapshot_time.replace("Z", "+00:00"))
-                    if snapshot_time
-                    else datetime.now()
-                )
+                if seen is not None and price_data.get("snapshotTime") in seen:
+                    continue
 
-                # Calculate mid prices
-                open_mid = (open_bid + open_ask) / 2 if open_bid and open_ask else None
-                high_mid = (high_bid + high_ask) / 2 if high_bid and high_ask else None
-                low_mid = (low_bid + low_ask) / 2 if low_bid and low_ask else None
-                close_mid = (
-                    (close_bid + close_ask) / 2 if close_bid and close_ask else None
-                )
-
-                processed_record = {
-                    "epic": epic,
-                    "timestamp": timestamp,
-                    "snapshot_time": snapshot_time,
-                    # OHLC Bid prices
-                    "open_bid": float(open_bid) if open_bid else None,
-                    "high_bid": float(high_bid) if high_bid else None,
-                    "low_bid": float(low_bid) if low_bid else None,
-                    "close_bid": float(close_bid) if close_bid else None,
-                    # OHLC Ask prices
-                    "open_ask": float(open_ask) if open_ask else None,
-                    "high_ask": float(high_ask) if high_ask else None,
-                    "low_ask": float(low_ask) if low_ask else None,
-                    "close_ask": float(close_ask) if close_ask else None,
-                    # OHLC Mid prices
-                    "open_mid": float(open_mid) if open_mid else None,
-                    "high_mid": float(high_mid) if high_mid else None,
-                    "low_mid": float(low_mid) if low_mid else None,
-                    "close_mid": float(close_mid) if close_mid else None,
-                    # Volume and last traded
-                    "volume": price_data.get("lastTradedVolume"),
-                    "last_traded": price_data.get("lastTradedPrice"),
-                    # Raw data for reference
-                    "raw_data": price_data,
-                }
-
-                processed.append(processed_record)
+                processed_record = self._process_single(price_data, epic)
+                if processed_record is not None:
+                    processed.append(processed_record)
+                    if seen is not None:
+                        seen[price_data["snapshotTime"]] = None
+                        if len(seen) > _SEEN_LIMIT:
+                            seen.popitem(last=False)
 
             except Exception as e:
                 logger.error(f"❌ Error processing price record: {e}")
@@ -327,6 +419,83 @@ class GoldDataFetcher:
 
         return processed
 
+    def _process_single(
+        self, price_data: Dict[str, Any], epic: str
+    ) -> Optional[Dict[str, Any]]:
+        """Process one raw price record; None if it has no timestamp"""
+        # Get timestamp first so skipped records cost nothing else
+        snapshot_time = price_data.get("snapshotTime")
+        if not snapshot_time:
+            logger.debug("⚠️ No snapshotTime in record: %s", price_data)
+            return None  # Skip records without timestamp
+
+        timestamp = _parse_capital_ts(snapshot_time)
+
+        # Extract OHLC data
+        open_price = price_data.get("openPrice", {})
+        high_price = price_data.get("highPrice", {})
+        low_price = price_data.get("lowPrice", {})
+        close_price = price_data.get("closePrice", {})
+
+        # Get bid/ask values as floats (missing or zero -> None)
+        open_bid = open_price.get("bid")
+        open_bid = float(open_bid) if open_bid else None
+        open_ask = open_price.get("ask") or open_price.get("offer")
+        open_ask = float(open_ask) if open_ask else None
+
+        high_bid = high_price.get("bid")
+        high_bid = float(high_bid) if high_bid else None
+        high_ask = high_price.get("ask") or high_price.get("offer")
+        high_ask = float(high_ask) if high_ask else None
+
+        low_bid = low_price.get("bid")
+        low_bid = float(low_bid) if low_bid else None
+        low_ask = low_price.get("ask") or low_price.get("offer")
+        low_ask = float(low_ask) if low_ask else None
+
+        close_bid = close_price.get("bid")
+        close_bid = float(close_bid) if close_bid else None
+        close_ask = close_price.get("ask") or close_price.get("offer")
+        close_ask = float(close_ask) if close_ask else None
+
+        # Calculate mid prices (already floats, no second conversion)
+        open_mid = (open_bid + open_ask) / 2 if open_bid and open_ask else None
+        high_mid = (high_bid + high_ask) / 2 if high_bid and high_ask else None
+        low_mid = (low_bid + low_ask) / 2 if low_bid and low_ask else None
+        close_mid = (
+            (close_bid + close_ask) / 2 if close_bid and close_ask else None
+        )
+
+        record = {
+            "epic": epic,
+            "timestamp": timestamp,
+            "snapshot_time": snapshot_time,
+            # OHLC Bid prices
+            "open_bid": open_bid,
+            "high_bid": high_bid,
+            "low_bid": low_bid,
+            "close_bid": close_bid,
+            # OHLC Ask prices
+            "open_ask": open_ask,
+            "high_ask": high_ask,
+            "low_ask": low_ask,
+            "close_ask": close_ask,
+            # OHLC Mid prices
+            "open_mid": open_mid,
+            "high_mid": high_mid,
+            "low_mid": low_mid,
+            "close_mid": close_mid,
+            # Volume and last traded
+            "volume": price_data.get("lastTradedVolume"),
+            "last_traded": price_data.get("lastTradedPrice"),
+        }
+
+        if self.keep_raw:
+            # Raw data for reference
+            record["raw_data"] = price_data
+
+        return record
+
     async def fetch_recent_data(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Fetch recent gold data for the specified number of hours"""
         to_date = datetime.now()
@@ -340,10 +509,14 @@ class GoldDataFetcher:
 
     async def fetch_daily_data(self, days: int = 30) -> List[Dict[str, Any]]:
         """Fetch daily gold data for the specified number of days"""
+        return await self._collect(self.stream_daily_data(days))
+
+    def stream_daily_data(self, days: int = 30) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream daily gold data for the specified number of days in pages"""
         to_date = datetime.now()
         from_date = to_date - timedelta(days=days)
 
-        return await self.fetch_historical_prices(
+        return self.stream_historical_prices(
             from_date=from_date,
             to_date=to_date,
             resolution="DAY",
@@ -352,6 +525,10 @@ class GoldDataFetcher:
 
     async def fetch_all_available_data(self) -> List[Dict[str, Any]]:
         """Fetch all available historical data (be careful with API limits!)"""
+        return await self._collect(self.stream_all_available_data())
+
+    def stream_all_available_data(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream all available historical data in pages (be careful with API limits!)"""
         logger.warning(
             "⚠️ Fetching ALL available data - this may take a while and consume API quota"
         )
@@ -360,7 +537,7 @@ class GoldDataFetcher:
         to_date = datetime.now()
         from_date = to_date - timedelta(days=365)
 
-        return await self.fetch_historical_prices(
+        return self.stream_historical_prices(
             from_date=from_date,
             to_date=to_date,
             max_pages=1000,  # Allow many pages for historical data
@@ -368,11 +545,18 @@ class GoldDataFetcher:
         )
 
     async def fetch_minute_data_batch(
-        self, start_date: datetime, end_date: datetime, epic: str = "GOLD"
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        epic: str = "GOLD",
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Fetch minute data for a specific date range (max 1 day)
         This method handles the strict API limits for minute data
+
+        Raw API pages are cached on disk, so re-running a backfill only calls
+        the API for windows it has not seen (or recent ones that may change).
         """
         # Ensure date range is not more than 1 day
         if end_date - start_date > timedelta(days=1):
@@ -386,26 +570,30 @@ class GoldDataFetcher:
         if start_date > now:
             start_date = now - timedelta(days=1)
 
-        logger.info(
-            f"📊 Fetching minute data for {epic} from {start_date} to {end_date}"
+        logger.debug(
+            "📊 Fetching minute data for %s from %s to %s", epic, start_date, end_date
         )
 
+        # Use the working date format
+        from_timestamp = start_date.strftime("%Y-%m-%dT%H:%M:%S")
+        to_timestamp = end_date.strftime("%Y-%m-%dT%H:%M:%S")
+
+        cache_key = f"{epic}|MINUTE|{from_timestamp}|{to_timestamp}|50"
+        if use_cache:
+            cached_prices = await self.cache.get(cache_key)
+            if cached_prices is not None:
+                logger.debug("💾 Cache hit: %s to %s", from_timestamp, to_timestamp)
+                return self._process_price_data(cached_prices, epic)
+
         # Ensure we're authenticated
         if not self.capital_service.is_authenticated:
             await self.capital_service.authenticate()
 
-        headers = {
-            "X-CAP-API-KEY": self.capital_service.api_key,
-            "CST": self.capital_service.session_token,
-            "X-SECURITY-TOKEN": self.capital_service.security_token,
-            "Version": "1",
-        }
+        headers = self.capital_service.get_headers()
+        throttled_retries = 0
+        auth_retries = 0
 
         try:
-            # Use the working date format
-            from_timestamp = start_date.strftime("%Y-%m-%dT%H:%M:%S")
-            to_timestamp = end_date.strftime("%Y-%m-%dT%H:%M:%S")
-
             url = f"{self.capital_service.base_url}/api/v1/prices/{epic}"
             params = {
                 "resolution": "MINUTE",
@@ -414,32 +602,66 @@ class GoldDataFetcher:
                 "max": 50,  # Very small batch for minute data
             }
 
-            logger.info(f"📡 API Request: {from_timestamp} to {to_timestamp}")
+            while True:
+                await self.rate_limiter.acquire()
+                async with self.session.get(
+                    url, headers=headers, params=params
+                ) as response:
+                    if response.status == 429 and throttled_retries < 3:
+                        throttled_retries += 1
+                        self._on_throttled(response)
+                        continue
 
-            async with self.session.get(
-                url, headers=headers, params=params
-            ) as response:
-                if response.status == 401:
-                    logger.warning("🔐 Authentication expired, re-authenticating...")
-                    await self.capital_service.authenticate()
-                    return []
+                    if response.status == 401 and auth_retries < 2:
+                        auth_retries += 1
+                        self.backpressure.on_error()
+                        logger.warning(
+                            "🔐 Authentication expired, re-authenticating..."
+                        )
+                        await self.capital_service.reauth_once(headers["CST"])
+                        headers = self.capital_service.get_headers()
+                        continue
 
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(
-                        f"❌ API request failed: {response.status} - {error_text}"
-                    )
-                    return []
+                    if response.status in (401, 429):
+                        # Retries used up: say so, rather than pass the window
+                        # off as one with no data
+                        self.backpressure.on_error()
+                        logger.warning(
+                            f"⚠️ Giving up on minute data {from_timestamp} to "
+                            f"{to_timestamp} after repeated {response.status} responses"
+                        )
+                        return []
 
-                data = await response.json()
-                prices = data.get("prices", [])
+                    if response.status != 200:
+                        if response.status >= 500:
+                            self.backpressure.on_error()
+                        error_text = await response.text()
+                        logger.error(
+                            f"❌ API request failed: {response.status} - {error_text}"
+                        )
+                        return []
 
-                if prices:
-                    logger.info(f"✅ Retrieved {len(prices)} minute records")
-                    return self._process_price_data(prices, epic)
-                else:
-                    logger.info(f"📭 No minute data available for this period")
-                    return []
+                    self.backpressure.on_success()
+                    self.capital_service.mark_session_active()
+                    data = orjson.loads(await response.read())
+                    prices = data.get("prices", [])
+
+                    if use_cache:
+                        # An empty page may be a transient gap in the API, so
+                        # only settled windows with data are kept for long
+                        settled = prices and now - end_date > _SETTLED_AFTER
+                        await self.cache.set(
+                            cache_key,
+                            prices,
+                            _SETTLED_CACHE_TTL if settled else _RECENT_CACHE_TTL,
+                        )
+
+                    if prices:
+                        logger.debug("✅ Retrieved %d minute records", len(prices))
+                        return self._process_price_data(prices, epic)
+                    else:
+                        logger.debug("📭 No minute data available for this period")
+                        return []
 
         except Exception as e:
             logger.error(f"❌ Error fetching minute data: {e}")
@@ -450,10 +672,45 @@ class GoldDataFetcher:
     ) -> List[Dict[str, Any]]:
         """
         Fetch the last year of minute data by breaking it into small batches
+
+        Results are returned in chronological order.
         """
-        logger.info(f"🚀 Starting to fetch last year of minute data for {epic}")
+        all_data = await self._collect(
+            self.stream_last_year_minute_data(epic, progress_callback)
+        )
+        # Batches arrive in completion order, not date order
+        all_data.sort(key=lambda record: record["timestamp"])
+
+        logger.info(
+            f"🎯 Completed fetching minute data! Total records: {len(all_data)}"
+        )
+        return all_data
+
+    async def export_last_year_minute_data(
+        self, sink: JSONLSink, epic: str = "GOLD", progress_callback=None
+    ) -> Dict[str, Any]:
+        """
+        Like fetch_last_year_minute_data, but write each day batch to sink as
+        soon as it completes (in completion order, not date order)
+
+        Returns:
+            The sink's stats (path, rows, batches)
+        """
+        async for batch in self.stream_last_year_minute_data(epic, progress_callback):
+            await sink.write_batch(batch)
+        return sink.stats()
+
+    async def stream_last_year_minute_data(
+        self, epic: str = "GOLD", progress_callback=None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the last year of minute data one day batch at a time
 
-        all_data = []
+        Day batches are independent, so several are in flight at once (up to
+        FETCH_CONCURRENCY, backing off on errors), and each is yielded as soon
+        as it finishes rather than waiting for the slowest one.
+        """
+        logger.info(f"🚀 Starting to fetch last year of minute data for {epic}")
 
         # Start from 1 year ago and work forward
         end_date = datetime.now() - timedelta(
@@ -461,51 +718,60 @@ class GoldDataFetcher:
         )  # Start 30 days ago (avoid recent data issues)
         start_date = end_date - timedelta(days=365)  # Go back 1 year
 
+        # 1-day batches
+        windows = []
         current_start = start_date
-        batch_count = 0
-        total_records = 0
-
-        # Process in 1-day batches
         while current_start < end_date:
-            batch_count += 1
             current_end = min(current_start + timedelta(days=1), end_date)
+            windows.append((current_start, current_end))
+            current_start = current_end
 
-            logger.info(
-                f"📅 Batch {batch_count}: {current_start.strftime('%Y-%m-%d')} to {current_end.strftime('%Y-%m-%d')}"
-            )
-
-            if progress_callback:
-                progress = ((current_start - start_date).days / 365) * 100
-                progress_callback(progress, batch_count, current_start, current_end)
-
-            # Fetch this batch
-            batch_data = await self.fetch_minute_data_batch(
-                epic, current_start, current_end
-            )
-
-            if batch_data:
-                all_data.extend(batch_data)
-                total_records += len(batch_data)
-                logger.info(
-                    f"✅ Batch {batch_count}: {len(batch_data)} records (Total: {total_records})"
+        async def fetch_window(batch_number: int, window_start, window_end):
+            async with self.backpressure:
+                batch_data = await self.fetch_minute_data_batch(
+                    window_start, window_end, epic=epic
                 )
-            else:
-                logger.warning(f"⚠️ Batch {batch_count}: No data")
+            return batch_number, window_start, window_end, batch_data
 
-            # Move to next day
-            current_start = current_end
+        tasks = [
+            asyncio.create_task(fetch_window(batch_number, window_start, window_end))
+            for batch_number, (window_start, window_end) in enumerate(windows, 1)
+        ]
+        total_records = 0
 
-            # Rate limiting - be very gentle with the API
-            await asyncio.sleep(1.0)  # 1 second between requests
+        try:
+            for completed, next_done in enumerate(asyncio.as_completed(tasks), 1):
+                batch_number, window_start, window_end, batch_data = await next_done
+
+                if batch_data:
+                    total_records += len(batch_data)
+                    logger.debug(
+                        "✅ Batch %d: %d records (Total: %d)",
+                        batch_number,
+                        len(batch_data),
+                        total_records,
+                    )
+                    yield batch_data
+                else:
+                    logger.debug("📭 Batch %d: No data", batch_number)
 
-            # Stop if we have a reasonable amount of data for testing
-            if total_records > 10000:  # Stop at 10k records for initial testing
-                logger.info(f"🛑 Stopping at {total_records} records for testing")
-                break
+                if completed % _PROGRESS_EVERY == 0:
+                    logger.info(
+                        f"📈 {completed}/{len(windows)} day batches done, {total_records} records so far"
+                    )
 
-        logger.info(
-            f"🎯 Completed fetching minute data! Total records: {len(all_data)}"
-        )
-        return all_data
+                if progress_callback:
+                    progress = (completed / len(windows)) * 100
+                    progress_callback(progress, batch_number, window_start, window_end)
+
+                # Stop if we have a reasonable amount of data for testing
+                if total_records > 10000:
+                    logger.info(f"🛑 Stopped at {total_records} records for testing")
+                    break
+        finally:
+            # Drop batches still queued or in flight (early stop or consumer exit)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     # ...existing code...
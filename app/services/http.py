@@ -0,0 +1,53 @@
+"""
+Process-wide aiohttp session for Capital.com REST requests
+"""
+
+from typing import Optional
+
+import aiohttp
+
+from ..core.config import get_settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared session, creating it on first use
+
+    Every fetcher shares one connection pool and DNS cache, so the TLS
+    handshakes to the API host are paid once per process. The session lives
+    until close_session() is called at shutdown.
+    """
+    global _session
+    # No await between the check and the assignment, so concurrent callers
+    # cannot create two sessions
+    if _session is None or _session.closed:
+        settings = get_settings()
+        # aiohttp speaks HTTP/1.1, so each in-flight request needs its own
+        # connection: the per-host pool covers the fetch concurrency plus the
+        # API service's own calls, so it never becomes a hidden second limit
+        pool_size = max(32, settings.FETCH_CONCURRENCY)
+        connector = aiohttp.TCPConnector(
+            limit=pool_size,
+            limit_per_host=pool_size,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=60)
+        )
+        logger.info("🌐 Created shared HTTP session")
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (application shutdown)"""
+    global _session
+    if _session is not None:
+        session, _session = _session, None
+        await session.close()
+        logger.info("✅ Shared HTTP session closed")
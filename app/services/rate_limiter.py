@@ -0,0 +1,106 @@
+"""
+Client-side rate limiting and backpressure for outgoing Capital.com requests
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """Sliding-window limiter: at most max_requests per window seconds"""
+
+    def __init__(self, max_requests: int, window: float = 60.0):
+        self.max_requests = max_requests
+        self.window = window
+        self._timestamps: Deque[float] = deque()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then record it"""
+        # Waiters queue on the lock, so slots are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                # Drop requests that have left the window
+                while self._timestamps and now - self._timestamps[0] >= self.window:
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.max_requests:
+                    self._timestamps.append(now)
+                    return
+
+                await asyncio.sleep(self.window - (now - self._timestamps[0]))
+
+    def defer(self, seconds: float) -> None:
+        """Hold back all requests for the given number of seconds (e.g. Retry-After)"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class Backpressure:
+    """
+    AIMD concurrency controller
+
+    Each success raises the allowed concurrency by `increase`; each throttling
+    or server error multiplies it by `decrease`. Use as an async context
+    manager around a request.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        initial: Optional[int] = None,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase = increase
+        self.decrease = decrease
+        self.concurrency = float(initial if initial is not None else maximum)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return max(self.minimum, int(self.concurrency))
+
+    def on_success(self) -> None:
+        """Additive increase"""
+        self.concurrency = min(self.maximum, self.concurrency + self.increase)
+
+    def on_error(self) -> None:
+        """Multiplicative decrease"""
+        self.concurrency = max(self.minimum, self.concurrency * self.decrease)
+        logger.warning(f"🐢 Backing off: concurrency limit now {self.limit}")
+
+    async def __aenter__(self) -> "Backpressure":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
+def retry_after_seconds(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a Retry-After header given in seconds, falling back to default"""
+    try:
+        return max(0.0, float(value)) if value else default
+    except ValueError:
+        return default
@@ -0,0 +1,61 @@
+"""
+Sinks for writing fetched price data to disk page by page
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import aiofiles
+import orjson
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class JSONLSink:
+    """Append processed price records to a JSON Lines file, one page at a time"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.rows = 0
+        self.batches = 0
+        self._file: Optional[Any] = None
+
+    async def __aenter__(self) -> "JSONLSink":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Open the target file for appending"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = await aiofiles.open(self.path, "ab")
+        logger.info(f"📝 Writing price data to {self.path}")
+
+    async def write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Write one page of records"""
+        if not batch:
+            return
+
+        await self._file.write(
+            b"".join(
+                orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+                for record in batch
+            )
+        )
+        self.rows += len(batch)
+        self.batches += 1
+
+    async def close(self) -> None:
+        """Flush and close the file"""
+        if self._file:
+            await self._file.close()
+            self._file = None
+            logger.info(f"✅ Wrote {self.rows} records to {self.path}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Rows and pages written so far"""
+        return {"path": str(self.path), "rows": self.rows, "batches": self.batches}
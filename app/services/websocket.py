@@ -3,31 +3,71 @@ Professional WebSocket connection manager with async best practices
 """
 
 import asyncio
-import json
 import uuid
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from itertools import islice
+from typing import Awaitable, Deque, Dict, List, Optional, Any, Callable, Union
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
-from ..core.config import settings
+from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..models.market import ConnectionInfo, WebSocketMessage, PriceTick
 
 logger = get_logger(__name__)
 
 
+def _encode_frame(
+    message_type: str,
+    data: Optional[Dict[str, Any]] = None,
+    timestamp: Union[datetime, str, None] = None,
+) -> str:
+    """
+    Encode a message as a JSON text frame, without building a WebSocketMessage
+
+    orjson writes datetimes in the same ISO format as isoformat(). Frames stay
+    text rather than bytes because the browser clients JSON.parse event.data.
+    """
+    return orjson.dumps(
+        {"type": message_type, "data": data, "timestamp": timestamp}
+    ).decode()
+
+
+def _encode_message(message: WebSocketMessage) -> str:
+    """Encode a WebSocketMessage as a JSON text frame"""
+    return _encode_frame(message.type, message.data, message.timestamp)
+
+
 class WebSocketManager:
     """
     Professional WebSocket connection manager
     """
 
     def __init__(self):
+        settings = get_settings()
         self.connections: Dict[str, WebSocket] = {}
         self.connection_info: Dict[str, ConnectionInfo] = {}
-        self._price_history: List[Dict[str, Any]] = []
         self._cleanup_task: Optional[asyncio.Task] = None
         self._max_connections = settings.WEBSOCKET_MAX_CONNECTIONS
         self._max_price_history = settings.MAX_PRICE_HISTORY
+        # Oldest ticks fall off the left end as new ones are appended
+        self._price_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self._max_price_history
+        )
+        # Encoded history frame for new connections; reset on every tick
+        self._history_frame: Optional[str] = None
+        # Client message type -> handler(connection_id, message)
+        self._handlers: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[None]]] = {
+            "ping": lambda cid, _: self._handle_ping(cid),
+            "get_current_price": lambda cid, _: self._handle_get_current_price(cid),
+            "get_price_history": lambda cid, data: self._handle_get_price_history(
+                cid, data.get("data", {})
+            ),
+            "start_streaming": lambda cid, _: self._handle_start_streaming(cid),
+            "stop_streaming": lambda cid, _: self._handle_stop_streaming(cid),
+        }
 
     async def initialize(self) -> None:
         """Initialize the WebSocket manager"""
@@ -73,12 +113,12 @@ class WebSocketManager:
         )
 
         # Send welcome message
-        await self.send_message(
+        await self._send_text(
             connection_id,
-            WebSocketMessage(
-                type="connection_established",
-                data={"connection_id": connection_id},
-                timestamp=datetime.now(),
+            _encode_frame(
+                "connection_established",
+                {"connection_id": connection_id},
+                datetime.now(),
             ),
         )
 
@@ -107,17 +147,17 @@ class WebSocketManager:
 
     async def send_message(self, connection_id: str, message: WebSocketMessage) -> bool:
         """Send message to specific connection"""
+        return await self._send_text(connection_id, _encode_message(message))
+
+    async def _send_text(self, connection_id: str, payload: str) -> bool:
+        """Send an already encoded frame to a specific connection"""
         if connection_id not in self.connections:
             return False
 
         websocket = self.connections[connection_id]
 
         try:
-            message_dict = message.dict()
-            if message_dict.get("timestamp"):
-                message_dict["timestamp"] = message_dict["timestamp"].isoformat()
-
-            await websocket.send_text(json.dumps(message_dict))
+            await websocket.send_text(payload)
             return True
 
         except WebSocketDisconnect:
@@ -135,27 +175,44 @@ class WebSocketManager:
         if not self.connections:
             return 0
 
-        successful_sends = 0
-        failed_connections = []
+        # Encoded once and shared by every connection
+        return await self._broadcast_text(_encode_message(message))
 
-        for connection_id in self.connections:
-            success = await self.send_message(connection_id, message)
-            if success:
-                successful_sends += 1
-            else:
+    async def _broadcast_text(self, payload: str) -> int:
+        """Send an already encoded frame to all connections"""
+        # Snapshot, since connections may be added or dropped while sending
+        connections = list(self.connections.items())
+
+        # Write to every client at once, so one slow socket does not delay the
+        # rest; failures come back as results instead of aborting the gather
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for _, websocket in connections),
+            return_exceptions=True,
+        )
+
+        failed_connections = []
+        for (connection_id, _), result in zip(connections, results):
+            if isinstance(result, WebSocketDisconnect):
+                logger.info(f"🔌 Client {connection_id} disconnected during send")
+                failed_connections.append(connection_id)
+            elif isinstance(result, Exception):
+                logger.error(f"❌ Error sending message to {connection_id}: {result}")
                 failed_connections.append(connection_id)
 
         # Clean up failed connections
         for connection_id in failed_connections:
             await self.disconnect(connection_id)
 
-        return successful_sends
+        return len(connections) - len(failed_connections)
 
     async def broadcast_price_update(self, price_tick: PriceTick) -> None:
         """Broadcast price update to all connections"""
+        # Formatted once and shared by the history entry and the frame
+        timestamp = price_tick.timestamp.isoformat()
+
         # Store in price history
         price_data = {
-            "timestamp": price_tick.timestamp.isoformat(),
+            "timestamp": timestamp,
             "bid": price_tick.bid,
             "ask": price_tick.ask,
             "mid": price_tick.mid,
@@ -168,77 +225,57 @@ class WebSocketManager:
         }
 
         self._price_history.append(price_data)
-
-        # Keep only recent history
-        if len(self._price_history) > self._max_price_history:
-            self._price_history = self._price_history[-self._max_price_history :]
+        self._history_frame = None
 
         # Broadcast to all connections
-        message = WebSocketMessage(
-            type="gold_price_update", data=price_data, timestamp=price_tick.timestamp
-        )
-
-        sent_count = await self.broadcast(message)
+        sent_count = 0
+        if self.connections:
+            sent_count = await self._broadcast_text(
+                _encode_frame("gold_price_update", price_data, timestamp)
+            )
 
         if sent_count > 0:
             logger.debug(f"📡 Price update broadcasted to {sent_count} connections")
 
-    async def handle_client_message(self, connection_id: str, message: str) -> None:
+    async def handle_client_message(
+        self, connection_id: str, message: Union[str, bytes]
+    ) -> None:
         """Handle message from client"""
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             message_type = data.get("type")
 
-            if message_type == "ping":
-                await self._handle_ping(connection_id)
-            elif message_type == "get_current_price":
-                await self._handle_get_current_price(connection_id)
-            elif message_type == "get_price_history":
-                await self._handle_get_price_history(
-                    connection_id, data.get("data", {})
-                )
-            elif message_type == "start_streaming":
-                await self._handle_start_streaming(connection_id)
-            elif message_type == "stop_streaming":
-                await self._handle_stop_streaming(connection_id)
+            handler = self._handlers.get(message_type)
+            if handler is not None:
+                await handler(connection_id, data)
             else:
                 logger.warning(
                     f"⚠️ Unknown message type from {connection_id}: {message_type}"
                 )
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"⚠️ Invalid JSON from {connection_id}: {message}")
         except Exception as e:
             logger.error(f"❌ Error handling message from {connection_id}: {e}")
 
     async def _handle_ping(self, connection_id: str) -> None:
         """Handle ping message"""
+        now = datetime.now()
         if connection_id in self.connection_info:
-            self.connection_info[connection_id].last_ping = datetime.now()
+            self.connection_info[connection_id].last_ping = now
 
-        await self.send_message(
-            connection_id, WebSocketMessage(type="pong", timestamp=datetime.now())
-        )
+        await self._send_text(connection_id, _encode_frame("pong", None, now))
 
     async def _handle_get_current_price(self, connection_id: str) -> None:
         """Handle request for current price"""
         if self._price_history:
-            latest_price = self._price_history[-1]
-            await self.send_message(
-                connection_id,
-                WebSocketMessage(
-                    type="current_price", data=latest_price, timestamp=datetime.now()
-                ),
-            )
+            data = self._price_history[-1]
         else:
-            await self.send_message(
-                connection_id,
-                WebSocketMessage(
-                    type="current_price",
-                    data={"error": "No price data available"},
-                    timestamp=datetime.now(),
-                ),
-            )
+            data = {"error": "No price data available"}
+
+        await self._send_text(
+            connection_id, _encode_frame("current_price", data, datetime.now())
+        )
 
     async def _handle_get_price_history(
         self, connection_id: str, params: Dict[str, Any]
@@ -246,43 +283,47 @@ class WebSocketManager:
         """Handle request for price history"""
         limit = min(params.get("limit", 100), 1000)  # Max 1000 records
 
-        history = self._price_history[-limit:] if self._price_history else []
+        history = self._recent_history(limit)
 
-        await self.send_message(
+        await self._send_text(
             connection_id,
-            WebSocketMessage(
-                type="price_history",
-                data={"history": history, "count": len(history)},
-                timestamp=datetime.now(),
+            _encode_frame(
+                "price_history",
+                {"history": history, "count": len(history)},
+                datetime.now(),
             ),
         )
 
+    def _recent_history(self, limit: int) -> List[Dict[str, Any]]:
+        """The last `limit` price points, oldest first"""
+        start = max(0, len(self._price_history) - limit)
+        return list(islice(self._price_history, start, None))
+
     async def _send_price_history(self, connection_id: str) -> None:
         """Send recent price history to new connection"""
         if self._price_history:
-            # Send last 50 price points
-            recent_history = self._price_history[-50:]
-
-            await self.send_message(
-                connection_id,
-                WebSocketMessage(
-                    type="price_history",
-                    data={"history": recent_history, "count": len(recent_history)},
-                    timestamp=datetime.now(),
-                ),
-            )
+            # Every new connection gets the same frame until the next tick, so
+            # it is encoded once and reused
+            if self._history_frame is None:
+                # Send last 50 price points
+                recent_history = self._recent_history(50)
+                self._history_frame = _encode_frame(
+                    "price_history",
+                    {"history": recent_history, "count": len(recent_history)},
+                    datetime.now(),
+                )
+
+            await self._send_text(connection_id, self._history_frame)
 
     async def _handle_start_streaming(self, connection_id: str) -> None:
         """Handle start streaming request"""
         logger.info(f"🎯 Starting streaming for connection: {connection_id}")
 
         # Send confirmation message
-        await self.send_message(
+        await self._send_text(
             connection_id,
-            WebSocketMessage(
-                type="streaming_started",
-                data={"status": "streaming_started"},
-                timestamp=datetime.now(),
+            _encode_frame(
+                "streaming_started", {"status": "streaming_started"}, datetime.now()
             ),
         )
 
@@ -295,12 +336,10 @@ class WebSocketManager:
         logger.info(f"🛑 Stopping streaming for connection: {connection_id}")
 
         # Send confirmation message
-        await self.send_message(
+        await self._send_text(
             connection_id,
-            WebSocketMessage(
-                type="streaming_stopped",
-                data={"status": "streaming_stopped"},
-                timestamp=datetime.now(),
+            _encode_frame(
+                "streaming_stopped", {"status": "streaming_stopped"}, datetime.now()
             ),
         )
 
@@ -16,7 +16,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "app"))
 from app.services.capital import CapitalAPIService
 from app.services.database import DatabaseService
 from app.services.data_fetcher import GoldDataFetcher
-from app.core.config import settings
+from app.services.http import close_session
+from app.core import event_loop
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -53,12 +55,17 @@ class GoldDataCollector:
 
     async def cleanup(self):
         """Cleanup all services"""
-        if self.data_fetcher:
-            await self.data_fetcher.cleanup()
-        if self.capital_service:
-            await self.capital_service.cleanup()
-        if self.database_service:
-            await self.database_service.cleanup()
+        try:
+            if self.data_fetcher:
+                await self.data_fetcher.cleanup()
+            if self.capital_service:
+                await self.capital_service.cleanup()
+            if self.database_service:
+                await self.database_service.cleanup()
+        finally:
+            # The shared session exists as soon as any service created it,
+            # even if initialization failed before the fetcher was set up
+            await close_session()
 
     async def collect_year_data(self, start_months_back: int = 12):
         """
@@ -231,4 +238,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -11,7 +11,9 @@ from typing import List, Dict, Any
 from app.services.capital import CapitalAPIService
 from app.services.database import DatabaseService
 from app.services.data_fetcher import GoldDataFetcher
-from app.core.config import settings
+from app.services.http import close_session
+from app.core import event_loop
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -45,12 +47,17 @@ class GoldDataBackfiller:
 
     async def cleanup(self):
         """Cleanup all services"""
-        if self.data_fetcher:
-            await self.data_fetcher.cleanup()
-        if self.capital_service:
-            await self.capital_service.cleanup()
-        if self.database_service:
-            await self.database_service.cleanup()
+        try:
+            if self.data_fetcher:
+                await self.data_fetcher.cleanup()
+            if self.capital_service:
+                await self.capital_service.cleanup()
+            if self.database_service:
+                await self.database_service.cleanup()
+        finally:
+            # The shared session exists as soon as any service created it,
+            # even if initialization failed before the fetcher was set up
+            await close_session()
         logger.info("✅ All services cleaned up")
 
     async def fetch_and_store_historical_data(
@@ -116,7 +123,7 @@ class GoldDataBackfiller:
             while not chunk_success and retry_count < max_retries:
                 try:
                     # Log fetch operation start
-                    fetch_log_id = await self.database_service.log_fetch_operation(
+                    await self.database_service.log_fetch_operation(
                         epic=epic,
                         resolution=resolution,
                         from_date=current_start,
@@ -340,4 +347,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
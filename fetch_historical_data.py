@@ -17,7 +17,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "app"))
 from app.services.capital import CapitalAPIService
 from app.services.database import DatabaseService
 from app.services.data_fetcher import GoldDataFetcher
-from app.core.config import settings
+from app.services.http import close_session
+from app.core import event_loop
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 load_dotenv()
@@ -50,12 +52,17 @@ class HistoricalDataManager:
 
     async def cleanup(self):
         """Cleanup all services"""
-        if self.data_fetcher:
-            await self.data_fetcher.cleanup()
-        if self.capital_service:
-            await self.capital_service.cleanup()
-        if self.database_service:
-            await self.database_service.cleanup()
+        try:
+            if self.data_fetcher:
+                await self.data_fetcher.cleanup()
+            if self.capital_service:
+                await self.capital_service.cleanup()
+            if self.database_service:
+                await self.database_service.cleanup()
+        finally:
+            # The shared session exists as soon as any service created it,
+            # even if initialization failed before the fetcher was set up
+            await close_session()
 
     async def fetch_year_data(self, epic: str = "GOLD", resolution: str = "MINUTE"):
         """
@@ -81,7 +88,7 @@ class HistoricalDataManager:
         start_time = time.time()
 
         # Log the start of fetch operation
-        log_id = await self.database_service.log_fetch_operation(
+        await self.database_service.log_fetch_operation(
             epic=epic,
             resolution=resolution,
             from_date=start_date,
@@ -312,4 +319,4 @@ async def main():
 if __name__ == "__main__":
     print("🏅 Gold Trading Platform - Historical Data Fetcher")
     print("=" * 60)
-    asyncio.run(main())
+    event_loop.run(main())
@@ -13,9 +13,10 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 import uvicorn
-from app.core.config import settings
+from app.core.config import get_settings
 
 if __name__ == "__main__":
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,